@@ -0,0 +1,46 @@
+from statistics import mean, median, pstdev
+
+import asynctkinter as atk
+
+
+def run(async_fn, **run_kwargs):
+    '''Runs ``async_fn`` under :func:`asynctkinter.run` and returns what it returned.'''
+    result = None
+
+    async def main(*, clock: atk.Clock, root):
+        nonlocal result
+        root.geometry('200x200')
+        result = await async_fn(clock=clock, root=root)
+        root.destroy()
+
+    atk.run(main, **run_kwargs)
+    return result
+
+
+def summarize(samples, scale=1000.) -> dict:
+    '''Summarizes a list of durations in seconds, in milliseconds by default.'''
+    s = sorted(samples)
+    return {
+        'n': len(s),
+        'mean': mean(s) * scale,
+        'median': median(s) * scale,
+        'stdev': pstdev(s) * scale,
+        'p95': s[int(len(s) * 0.95) - 1] * scale,
+        'max': s[-1] * scale,
+    }
+
+
+LOOP_CONFIGS = (
+    {'fps': 20, 'event_driven': False},
+    {'fps': 60, 'event_driven': False},
+    {'fps': 20, 'event_driven': True},
+    {'fps': 60, 'event_driven': True},
+    {'fps': (4, 60), 'event_driven': False},
+)
+
+
+def config_name(config: dict) -> str:
+    fps = config['fps']
+    if isinstance(fps, tuple):
+        fps = '{}-{}'.format(*fps)
+    return ('event_driven' if config['event_driven'] else 'polling') + f"@{fps}fps"
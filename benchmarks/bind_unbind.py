@@ -0,0 +1,67 @@
+'''
+Measures bind/unbind throughput while a varying number of other bindings co-exist on the same (widget, sequence) pair.
+
+* ``tkinter``: ``widget.bind(seq, func, "+")`` + the patched ``Misc.unbind()``
+* ``asynctkinter``: ``asynctkinter.bind()`` + ``asynctkinter.unbind()``
+
+Requires a display (use Xvfb when running headless).
+'''
+
+from time import perf_counter
+import tkinter as tk
+import asynctkinter as atk
+
+SEQUENCE = "<<Bench>>"
+
+
+def callback(e):
+    pass
+
+
+def bench_tkinter(widget, n_cycles):
+    bind = widget.bind
+    unbind = widget.unbind
+    t = perf_counter()
+    for __ in range(n_cycles):
+        unbind(SEQUENCE, bind(SEQUENCE, callback, "+"))
+    return perf_counter() - t
+
+
+def bench_asynctkinter(widget, n_cycles):
+    bind = atk.bind
+    unbind = atk.unbind
+    t = perf_counter()
+    for __ in range(n_cycles):
+        unbind(widget, SEQUENCE, bind(widget, SEQUENCE, callback))
+    return perf_counter() - t
+
+
+def measure(n_cycles=1000, n_existing_list=(1, 10, 100, 1000)) -> list[dict]:
+    atk.install()
+    root = tk.Tk()
+    results = []
+    for n_existing in n_existing_list:
+        w1 = tk.Frame(root)
+        w2 = tk.Frame(root)
+        for __ in range(n_existing):
+            w1.bind(SEQUENCE, callback, "+")
+            atk.bind(w2, SEQUENCE, callback)
+        results.append({
+            'co_existing': n_existing,
+            'tkinter_ops_per_sec': n_cycles / bench_tkinter(w1, n_cycles),
+            'asynctkinter_ops_per_sec': n_cycles / bench_asynctkinter(w2, n_cycles),
+        })
+        w1.destroy()
+        w2.destroy()
+    root.destroy()
+    return results
+
+
+def main():
+    print(f"{'co-existing':>12} {'tkinter (ops/s)':>16} {'asynctkinter (ops/s)':>21}")
+    for r in measure():
+        print(f"{r['co_existing']:>12} {r['tkinter_ops_per_sec']:>16.0f} {r['asynctkinter_ops_per_sec']:>21.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+'''
+Compares the cost of delivering ``<Motion>`` events as full :class:`tkinter.Event` objects against delivering them
+as lightweight records that only contain the requested fields (``asynctkinter.bind(..., fields=...)``).
+
+Requires a display (use Xvfb when running headless).
+'''
+
+from time import perf_counter
+import tkinter as tk
+import asynctkinter as atk
+from asynctkinter._tkinter_stuffs import _make_substitute
+
+
+def bench_substitution(widget, fields, n_calls):
+    '''The conversion alone, with pre-made Tcl strings.'''
+    full_args = ('1', '??', '0', '??', '??', '16', '12345', '??', '10', '20', '??', '0', '??', '??', widget._w,
+                 '6', '110', '120', '0')
+    substitute_full = widget._substitute
+    t = perf_counter()
+    for __ in range(n_calls):
+        substitute_full(*full_args)
+    t_full = perf_counter() - t
+
+    few_args = ('10', '20')
+    substitute_few = _make_substitute(widget, fields)
+    t = perf_counter()
+    for __ in range(n_calls):
+        substitute_few(*few_args)
+    t_few = perf_counter() - t
+    return t_full, t_few
+
+
+def bench_delivery(widget, fields, n_events):
+    '''From ``event_generate()`` to the Python callback.'''
+    def callback(e):
+        pass
+
+    results = []
+    for fields_ in (None, fields):
+        funcid = atk.bind(widget, "<Motion>", callback, fields=fields_)
+        event_generate = widget.event_generate
+        t = perf_counter()
+        for i in range(n_events):
+            event_generate("<Motion>", x=i % 100, y=i % 100)
+        results.append(perf_counter() - t)
+        atk.unbind(widget, "<Motion>", funcid)
+    return results
+
+
+def measure(n=20000, fields=('x', 'y')) -> dict:
+    root = tk.Tk()
+    root.geometry("200x200")
+    frame = tk.Frame(root, width=200, height=200)
+    frame.pack()
+    root.update()
+    subst_full, subst_few = bench_substitution(frame, fields, n)
+    delivery_full, delivery_few = bench_delivery(frame, fields, n)
+    root.destroy()
+    return {
+        'fields': fields,
+        'substitution_per_sec': {'tkinter_event': n / subst_full, 'fields': n / subst_few},
+        'delivery_per_sec': {'tkinter_event': n / delivery_full, 'fields': n / delivery_few},
+    }
+
+
+def main():
+    r = measure()
+    for key, label in (('substitution_per_sec', 'substitution only'), ('delivery_per_sec', 'event_generate()')):
+        full = r[key]['tkinter_event']
+        few = r[key]['fields']
+        print(f"{label:<18}: tkinter.Event {full:>10.0f}/s  fields={r['fields']} {few:>10.0f}/s  ({few / full:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+'''
+Measures how many events per second a task consuming an ``asynctkinter.event_freq`` can handle.
+
+Requires a display (use Xvfb when running headless).
+'''
+
+from time import perf_counter
+import asynctkinter as atk
+
+from _common import run
+
+
+async def _measure(*, clock: atk.Clock, root, n, fields):
+    n_received = 0
+
+    async def consume():
+        nonlocal n_received
+        with atk.event_freq(root, "<<Tick>>", fields=fields) as tick:
+            while True:
+                await tick()
+                n_received += 1
+
+    event_generate = root.event_generate
+    async with atk.open_nursery() as nursery:
+        nursery.start(consume(), daemon=True)
+        t = perf_counter()
+        for __ in range(n):
+            event_generate("<<Tick>>")
+        elapsed = perf_counter() - t
+    assert n_received == n, (n_received, n)
+    return n / elapsed
+
+
+def measure(n=20000) -> dict:
+    '''Returns the throughput in events per second.'''
+    return {
+        'tkinter_event': run(lambda **kw: _measure(n=n, fields=None, **kw)),
+        'fields': run(lambda **kw: _measure(n=n, fields=('serial', ), **kw)),
+    }
+
+
+def main():
+    for name, eps in measure().items():
+        print(f"{name:<14} {eps:10.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
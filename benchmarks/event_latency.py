@@ -0,0 +1,41 @@
+'''
+Measures how long it takes for a task awaiting ``asynctkinter.event()`` to get resumed after the event was supposed
+to arrive, under various ``run()`` configurations. The event is generated by a Tcl timer, so it has to go through
+the main loop just like user input does.
+
+Requires a display (use Xvfb when running headless).
+'''
+
+from time import perf_counter
+import asynctkinter as atk
+
+from _common import run, summarize, LOOP_CONFIGS, config_name
+
+
+async def _measure(*, clock: atk.Clock, root, n):
+    latencies = []
+    event_generate = root.event_generate
+    for __ in range(n):
+        await clock.sleep(0.01)
+        fire_at = perf_counter() + 0.005
+        root.after(5, event_generate, "<<Ping>>")
+        await atk.event(root, "<<Ping>>")
+        latencies.append(perf_counter() - fire_at)
+    return latencies
+
+
+def measure(n=100) -> dict:
+    '''Returns the latency statistics in milliseconds for each configuration.'''
+    return {
+        config_name(config): summarize(run(lambda **kw: _measure(n=n, **kw), **config))
+        for config in LOOP_CONFIGS
+    }
+
+
+def main():
+    for name, s in measure().items():
+        print(f"{name:<20} mean {s['mean']:6.2f}ms  p95 {s['p95']:6.2f}ms  max {s['max']:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+'''
+Measures the frame jitter of ``run()`` while something is animating, and its CPU usage while the application is
+idle, under various configurations.
+
+Requires a display (use Xvfb when running headless).
+'''
+
+from time import perf_counter, process_time
+import asynctkinter as atk
+
+from _common import run, summarize, LOOP_CONFIGS, config_name
+
+
+async def _measure_jitter(*, clock: atk.Clock, root, duration):
+    intervals = []
+    last = perf_counter()
+    async for __ in clock.anim_with_dt():
+        now = perf_counter()
+        intervals.append(now - last)
+        last = now
+        if len(intervals) > 5 and sum(intervals) > duration:
+            break
+    return intervals[1:]
+
+
+async def _measure_idle_cpu(*, clock: atk.Clock, root, duration):
+    await clock.sleep(0.2)
+    wall = perf_counter()
+    cpu = process_time()
+    await clock.sleep(duration)
+    return (process_time() - cpu) / (perf_counter() - wall)
+
+
+def measure(duration=2.0) -> dict:
+    '''
+    Returns, for each configuration, the frame interval statistics in milliseconds and the idle CPU usage as a
+    fraction of one core.
+    '''
+    results = {}
+    for config in LOOP_CONFIGS:
+        intervals = run(lambda **kw: _measure_jitter(duration=duration, **kw), **config)
+        results[config_name(config)] = {
+            'frame_interval': summarize(intervals),
+            'achieved_fps': len(intervals) / sum(intervals),
+            'idle_cpu': run(lambda **kw: _measure_idle_cpu(duration=duration, **kw), **config),
+        }
+    return results
+
+
+def main():
+    for name, r in measure().items():
+        s = r['frame_interval']
+        print(f"{name:<20} {r['achieved_fps']:6.1f}fps  jitter(stdev) {s['stdev']:6.2f}ms  "
+              f"max {s['max']:6.2f}ms  idle CPU {r['idle_cpu'] * 100:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
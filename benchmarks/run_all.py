@@ -0,0 +1,129 @@
+'''
+Runs all the benchmarks and writes the results as JSON, so that they can be compared between versions.
+
+.. code-block:: text
+
+    python benchmarks/run_all.py --xvfb -o new.json
+    python benchmarks/run_all.py --xvfb -o new.json --compare old.json
+
+``--xvfb`` starts a private Xvfb server for the duration of the run, which lets the benchmarks run headless.
+'''
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+import tkinter
+from importlib.metadata import version, PackageNotFoundError
+
+import bind_unbind
+import event_fields
+import event_latency
+import event_freq_throughput
+import frame_loop
+import thread_latency
+
+BENCHMARKS = {
+    'event_latency_ms': event_latency.measure,
+    'event_freq_events_per_sec': event_freq_throughput.measure,
+    'bind_unbind': bind_unbind.measure,
+    'event_fields': event_fields.measure,
+    'frame_loop': frame_loop.measure,
+    'thread_latency_ms': thread_latency.measure,
+}
+
+
+def start_xvfb(display=':99'):
+    if shutil.which('Xvfb') is None:
+        sys.exit("Xvfb is not installed.")
+    proc = subprocess.Popen(
+        ['Xvfb', display, '-screen', '0', '1280x1024x24', '-nolisten', 'tcp'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    time.sleep(1.0)
+    if proc.poll() is not None:
+        sys.exit(f"Failed to start Xvfb on {display}.")
+    os.environ['DISPLAY'] = display
+    return proc
+
+
+def get_version(dist):
+    try:
+        return version(dist)
+    except PackageNotFoundError:
+        return None
+
+
+def flatten(d: dict, prefix='') -> dict:
+    flat = {}
+    for key, value in d.items():
+        key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, key + '.'))
+        elif isinstance(value, list):
+            flat.update(flatten({str(i): v for i, v in enumerate(value)}, key + '.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[key] = value
+    return flat
+
+
+def compare(old: dict, new: dict):
+    old_flat = flatten(old['results'])
+    new_flat = flatten(new['results'])
+    print(f"{'metric':<80} {'old':>12} {'new':>12} {'new/old':>8}")
+    for key, new_value in new_flat.items():
+        if (old_value := old_flat.get(key)) is None:
+            continue
+        ratio = new_value / old_value if old_value else float('nan')
+        print(f"{key:<80} {old_value:>12.3f} {new_value:>12.3f} {ratio:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-o', '--output', help="Where to write the JSON. Defaults to stdout.")
+    parser.add_argument('--xvfb', action='store_true', help="Run the benchmarks on a private Xvfb server.")
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, help="Run only the given benchmarks.")
+    parser.add_argument('--compare', metavar='OLD_JSON', help="Print the ratios to a previous result.")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb() if args.xvfb else None
+    try:
+        results = {}
+        for name, measure in BENCHMARKS.items():
+            if args.only and name not in args.only:
+                continue
+            print(f"running {name} ...", file=sys.stderr)
+            results[name] = measure()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    report = {
+        'versions': {
+            'asynctkinter': get_version('asynctkinter'),
+            'asyncgui': get_version('asyncgui'),
+            'asyncgui-ext-clock': get_version('asyncgui-ext-clock'),
+            'python': platform.python_version(),
+            'tk': tkinter.TkVersion,
+        },
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
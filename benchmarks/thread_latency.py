@@ -0,0 +1,63 @@
+'''
+Measures how long ``run_in_thread()`` and ``run_in_executor()`` take to get the caller back after the function has
+returned, both when the worker wakes the caller directly (the clock created by ``run()``) and when the caller polls
+at a given ``polling_interval`` (any other clock).
+
+Requires a display (use Xvfb when running headless).
+'''
+
+from time import perf_counter, sleep
+from concurrent.futures import ThreadPoolExecutor
+import asyncgui_ext.clock
+import asynctkinter as atk
+
+from _common import run, summarize
+
+WORK = 0.005
+
+
+def work():
+    sleep(WORK)
+
+
+async def _measure(*, clock: atk.Clock, root, n, polling_intervals):
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def collect(name, run_once):
+        overheads = []
+        for __ in range(n):
+            t = perf_counter()
+            await run_once()
+            overheads.append(perf_counter() - t - WORK)
+        results[name] = summarize(overheads)
+
+    await collect('run_in_thread', lambda: atk.run_in_thread(clock, work))
+    await collect('run_in_executor', lambda: atk.run_in_executor(clock, executor, work))
+
+    # A clock that run() doesn't know about, which makes the functions fall back to polling.
+    polling_clock = asyncgui_ext.clock.Clock()
+    with clock.schedule_interval(polling_clock.tick, 0):
+        for pi in polling_intervals:
+            await collect(
+                f'run_in_thread(polling_interval={pi})',
+                lambda: atk.run_in_thread(polling_clock, work, polling_interval=pi))
+            await collect(
+                f'run_in_executor(polling_interval={pi})',
+                lambda: atk.run_in_executor(polling_clock, executor, work, polling_interval=pi))
+    executor.shutdown()
+    return results
+
+
+def measure(n=20, polling_intervals=(0.05, 0.2, 1.0)) -> dict:
+    '''Returns the completion latency statistics in milliseconds, excluding the time the function itself takes.'''
+    return run(lambda **kw: _measure(n=n, polling_intervals=polling_intervals, **kw), fps=60, event_driven=True)
+
+
+def main():
+    for name, s in measure().items():
+        print(f"{name:<42} mean {s['mean']:8.2f}ms  max {s['max']:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,6 @@ async def main(*, clock: atk.Clock, root: tk.Tk):
         clock,
         lambda: requests.get("https://httpbin.org/delay/2"),
         daemon=True,
-        polling_interval=0.2,
     )
     label['text'] = res.json()['headers']['User-Agent']
 
@@ -42,14 +42,12 @@ async def main(*, clock: atk.Clock, root: tk.Tk):
                 clock,
                 lambda: session.get("https://httpbin.org/delay/2"),
                 daemon=True,
-                polling_interval=0.4,
             )
             label['text'] = 'second request...'
             await atk.run_in_thread(
                 clock,
                 lambda: session.get("https://httpbin.org/delay/2"),
                 daemon=True,
-                polling_interval=0.4,
             )
 
     label["text"] = "cancelled" if cancel_tracker.finished else "all requests done"
@@ -29,7 +29,7 @@ async def draw_rect(canvas: tk.Canvas, e_press: tk.Event):
     rect = canvas.create_rectangle(ox, oy, ox, oy, outline='orange', width=3)
     async with (
         atk.move_on_when(atk.event(canvas, '<ButtonRelease>', filter=lambda e: e.num == e_press.num)),
-        atk.event_freq(canvas, '<Motion>') as mouse_motion,
+        atk.event_freq(canvas, '<Motion>', coalesce=True) as mouse_motion,
     ):
         while True:
             e = await mouse_motion()
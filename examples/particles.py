@@ -0,0 +1,45 @@
+'''
+* NumPy is required to run this example.
+* Click anywhere to make particles burst out from that point.
+'''
+
+import random
+import tkinter as tk
+import asynctkinter as atk
+
+
+async def main(*, clock: atk.Clock, root: tk.Tk):
+    root.title("Particles")
+    root.geometry('800x800')
+    canvas = tk.Canvas(root, bg='black')
+    canvas.pack(expand=True, fill='both')
+    animator = atk.CanvasAnimator(clock, canvas)
+    colors = ('white', 'yellow', 'orange', 'red', 'skyblue')
+
+    async def burst(x, y, n=2000, r=3):
+        items = [
+            canvas.create_oval(x - r, y - r, x + r, y + r, fill=random.choice(colors), outline='')
+            for __ in range(n)
+        ]
+        tracks = []
+        for item in items:
+            dx = random.gauss(0, 200)
+            dy = random.gauss(0, 200)
+            tracks.append(animator.animate(
+                item, 'coords', None, (x + dx - r, y + dy - r, x + dx + r, y + dy + r),
+                duration=random.uniform(0.5, 2.0), easing='out_cubic',
+            ))
+        try:
+            for track in tracks:
+                await track
+        finally:
+            canvas.delete(*items)
+
+    async with atk.open_nursery() as nursery:
+        while True:
+            e = await atk.event(canvas, "<ButtonPress>", fields=('x', 'y'))
+            nursery.start(burst(e.x, e.y))
+
+
+if __name__ == '__main__':
+    atk.run(main, fps=60)
@@ -18,13 +18,14 @@ async def run_progress_spinner(
         x1, y1, x2, y2,
         outline=line_color, width=line_width, start=start, extent=extent, style='arc',
     )
+    batcher = atk.get_canvas_batcher(clock, draw_target)
     try:
         d = 0.5 / speed
         while True:
             next_start = get_next_start()
             next_extent = get_next_extent()
             async for s, e in clock.interpolate_seq((start, extent), (next_start, next_extent), duration=d):
-                draw_target.itemconfig(arc, start=s, extent=e)
+                batcher.itemconfig(arc, start=s, extent=e)
             start = next_start
             extent = next_extent
     finally:
@@ -0,0 +1,34 @@
+'''
+Talks HTTP over a raw socket without using any thread.
+'''
+
+import socket
+import tkinter as tk
+
+import asynctkinter as atk
+
+
+async def http_get(clock, host, path='/'):
+    with socket.socket() as sock:
+        sock.setblocking(False)
+        await atk.sock_connect(clock, sock, (host, 80))
+        await atk.sock_sendall(clock, sock, f"GET {path} HTTP/1.0\r\nHost: {host}\r\n\r\n".encode())
+        chunks = []
+        while chunk := await atk.sock_recv(clock, sock, 65536):
+            chunks.append(chunk)
+    return b''.join(chunks)
+
+
+async def main(*, clock: atk.Clock, root: tk.Tk):
+    root.title("HTTP Request over a raw socket")
+    root.geometry('1000x400')
+    label = tk.Label(root, text='Press to start a HTTP request', font=('', 40))
+    label.pack(expand=True)
+    await atk.event(label, "<ButtonPress>")
+    label['text'] = 'waiting for the server to respond...'
+    response = await http_get(clock, 'httpbin.org', '/delay/2')
+    label['text'] = response.split(b'\r\n', 1)[0].decode()
+
+
+if __name__ == '__main__':
+    atk.run(main)
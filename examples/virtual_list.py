@@ -0,0 +1,36 @@
+'''
+Streams a million rows into a list while it can be scrolled.
+'''
+
+import time
+import tkinter as tk
+
+import asynctkinter as atk
+
+
+def generate_rows():
+    for i in range(1_000_000):
+        if i % 1000 == 0:
+            time.sleep(0.01)  # pretend to be a slow query
+        yield (i, f"{time.time():.3f}", f"message #{i}")
+
+
+async def main(*, clock: atk.Clock, root: tk.Tk):
+    root.title("Virtual List")
+    root.geometry('600x400')
+    scrollbar = tk.Scrollbar(root)
+    scrollbar.pack(side='right', fill='y')
+    vlist = atk.VirtualList(
+        clock, root, columns=(80, 140, 380), yscrollcommand=scrollbar.set, background='white',
+        highlightthickness=0)
+    vlist.canvas.pack(side='left', fill='both', expand=True)
+    scrollbar['command'] = vlist.yview
+    async with atk.run_as_daemon(vlist.handle_events()):
+        async with atk.iterate_in_thread(clock, generate_rows, daemon=True) as rows:
+            await vlist.feed(rows)
+        root.title(f"Virtual List ({len(vlist.source)} rows)")
+        await atk.sleep_forever()
+
+
+if __name__ == '__main__':
+    atk.run(main)
@@ -1,3 +1,12 @@
 from asyncgui import *
-from asyncgui_ext.clock import Clock
 from ._tkinter_stuffs import *
+from ._frame_stats import *
+from ._canvas import *
+from ._animation import *
+from ._profiler import *
+from ._io import *
+from ._asyncio import *
+from ._process import *
+from ._variable import *
+from ._rate_limit import *
+from ._virtual_list import *
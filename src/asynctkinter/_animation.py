@@ -0,0 +1,290 @@
+__all__ = ('CanvasAnimator', 'AnimationTrack', )
+
+from tkinter import _stringify
+
+from asyncgui import _current_task
+
+from ._tkinter_stuffs import Clock
+
+
+def _create_easings(np):
+    pi = np.pi
+    cos = np.cos
+    sin = np.sin
+    where = np.where
+    return {
+        'linear': lambda p: p,
+        'in_quad': lambda p: p * p,
+        'out_quad': lambda p: p * (2. - p),
+        'in_out_quad': lambda p: where(p < .5, 2. * p * p, (4. - 2. * p) * p - 1.),
+        'in_cubic': lambda p: p * p * p,
+        'out_cubic': lambda p: (p - 1.) ** 3 + 1.,
+        'in_out_cubic': lambda p: where(p < .5, 4. * p * p * p, (p - 1.) * (2. * p - 2.) ** 2 + 1.),
+        'in_sine': lambda p: 1. - cos(p * (pi / 2.)),
+        'out_sine': lambda p: sin(p * (pi / 2.)),
+        'in_out_sine': lambda p: (1. - cos(p * pi)) / 2.,
+    }
+
+
+class AnimationTrack:
+    '''
+    A single animated (item, property) pair, returned by :meth:`CanvasAnimator.animate`.
+
+    Awaiting it waits for the animation to end. If the awaiting task gets cancelled, the animation gets cancelled as
+    well. You don't have to await it, though; an animation that nobody awaits runs to the end on its own.
+
+    .. code-block::
+
+        track = animator.animate(item, 'coords', (0, 0, 10, 10), (100, 100, 110, 110), duration=1)
+        await track
+    '''
+    __slots__ = ('item', 'property', 'finished', 'cancelled', '_prefix', '_values', '_waiting_tasks', )
+
+    def __init__(self, item, property, prefix, values):
+        self.item = item
+        self.property = property
+        self.finished = False
+        '''Whether the animation has reached the end.'''
+        self.cancelled = False
+        '''Whether the animation has been cancelled before reaching the end.'''
+        self._prefix = prefix
+        self._values = values  # (start, end, duration, easing) until the animator takes it in
+        self._waiting_tasks = None
+
+    def cancel(self):
+        '''Stops the animation where it is. The item keeps the value it had on the last frame.'''
+        if not self.finished:
+            self.cancelled = True
+
+    @property
+    def done(self) -> bool:
+        return self.finished or self.cancelled
+
+    def _attach_task(self, task):
+        if (tasks := self._waiting_tasks) is None:
+            self._waiting_tasks = [task]
+        else:
+            tasks.append(task)
+
+    def _resume_waiting_tasks(self):
+        if (tasks := self._waiting_tasks) is not None:
+            self._waiting_tasks = None
+            for task in tasks:
+                task._step()
+
+    def __await__(self):
+        if self.finished or self.cancelled:
+            return
+        task = (yield _current_task)[0][0]
+        try:
+            yield self._attach_task
+        finally:
+            if not (self.finished or self.cancelled):
+                # The awaiting task got cancelled.
+                self.cancelled = True
+                self._waiting_tasks.remove(task)
+
+
+class CanvasAnimator:
+    '''
+    Animates numeric properties of many canvas items at once. Instead of running one coroutine and one Python
+    interpolation per item, it keeps all the ongoing animations in NumPy arrays, advances them in a single vectorised
+    step per frame, writes the results back to Tcl as a single script, and retires the finished ones in bulk.
+
+    .. code-block::
+
+        animator = CanvasAnimator(clock, canvas)
+        for item in items:
+            animator.animate(item, 'coords', None, random_coords(), duration=2, easing='out_cubic')
+        await animator.animate(label_item, 'width', 1, 10, duration=2)
+
+    Requires NumPy.
+
+    The ``property`` is either ``'coords'`` or the name of a numeric item option, such as ``'width'``, ``'start'`` or
+    ``'extent'``. The ``easing`` is either one of ``'linear'``, ``'in_quad'``, ``'out_quad'``, ``'in_out_quad'``,
+    ``'in_cubic'``, ``'out_cubic'``, ``'in_out_cubic'``, ``'in_sine'``, ``'out_sine'``, ``'in_out_sine'``, or a
+    function that maps an array of progressions in [0, 1] to an array of the same shape.
+
+    .. versionadded:: 0.6.0
+    '''
+    def __init__(self, clock: Clock, canvas):
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("CanvasAnimator requires NumPy. Install it with 'pip install numpy'.") from e
+        self._np = np
+        self._clock = clock
+        self._canvas = canvas
+        self._eval = canvas.tk.eval
+        self._easings = _create_easings(np)
+        self._easing_funcs = []  # easing code -> function
+        self._clock_event = None
+        self._new_tracks = []
+
+        # per track
+        self._tracks = []
+        self._t0 = np.empty(0)
+        self._inv_duration = np.empty(0)
+        self._easing_codes = np.empty(0, dtype=np.intp)
+        self._offsets = [0]
+
+        # per element
+        self._start = np.empty(0)
+        self._delta = np.empty(0)
+        self._elem_track = np.empty(0, dtype=np.intp)
+
+    def __len__(self):
+        '''The number of ongoing animations.'''
+        return len(self._tracks) + len(self._new_tracks)
+
+    def animate(self, item, property, start, end, *, duration, easing='linear') -> AnimationTrack:
+        '''
+        Starts animating the ``property`` of the ``item`` from ``start`` to ``end``. If ``start`` is None, the current
+        value is used.
+        '''
+        canvas = self._canvas
+        path = canvas._w
+        item_str = _stringify(item)
+        if property == 'coords':
+            if start is None:
+                start = canvas.coords(item)
+            prefix = f"{path} coords {item_str} "
+        else:
+            if start is None:
+                start = float(canvas.itemcget(item, property))
+            start = (start, )
+            end = (end, )
+            prefix = f"{path} itemconfigure {item_str} -{property} "
+        if len(start) != len(end):
+            raise ValueError(f"'start' and 'end' must have the same length. ({len(start)} != {len(end)})")
+        if isinstance(easing, str):
+            easing = self._easings[easing]
+        track = AnimationTrack(item, property, prefix, (start, end, duration, easing))
+        self._new_tracks.append(track)
+        if self._clock_event is None:
+            self._clock_event = self._clock.schedule_interval(self._step, 0)
+        return track
+
+    def cancel_all(self):
+        for track in self._tracks:
+            track.cancel()
+        for track in self._new_tracks:
+            track.cancel()
+
+    def _get_easing_code(self, easing) -> int:
+        funcs = self._easing_funcs
+        for code, f in enumerate(funcs):
+            if f is easing:
+                return code
+        funcs.append(easing)
+        return len(funcs) - 1
+
+    def _take_in_new_tracks(self):
+        np = self._np
+        new_tracks = self._new_tracks
+        self._new_tracks = []
+        now = self._clock.current_time
+        offsets = self._offsets
+        n_tracks = len(self._tracks)
+        t0 = []
+        inv_duration = []
+        easing_codes = []
+        start = []
+        delta = []
+        elem_track = []
+        for i, track in enumerate(new_tracks, start=n_tracks):
+            start_values, end_values, duration, easing = track._values
+            track._values = None
+            n = len(start_values)
+            if duration > 0:
+                t0.append(now)
+                inv_duration.append(1. / duration)
+            else:
+                # jumps to the end on the first frame
+                t0.append(now - 1.)
+                inv_duration.append(1.)
+            easing_codes.append(self._get_easing_code(easing))
+            start.extend(start_values)
+            delta.extend(e - s for s, e in zip(start_values, end_values))
+            elem_track.extend([i] * n)
+            offsets.append(offsets[-1] + n)
+        self._tracks.extend(new_tracks)
+        concatenate = np.concatenate
+        self._t0 = concatenate((self._t0, t0))
+        self._inv_duration = concatenate((self._inv_duration, inv_duration))
+        self._easing_codes = concatenate((self._easing_codes, np.array(easing_codes, dtype=np.intp)))
+        self._start = concatenate((self._start, start))
+        self._delta = concatenate((self._delta, delta))
+        self._elem_track = concatenate((self._elem_track, np.array(elem_track, dtype=np.intp)))
+
+    def _step(self, dt):
+        np = self._np
+        if self._new_tracks:
+            self._take_in_new_tracks()
+        tracks = self._tracks
+
+        # progression
+        p = (self._clock.current_time - self._t0) * self._inv_duration
+        np.clip(p, 0., 1., out=p)
+        if (funcs := self._easing_funcs) and len(funcs) == 1:
+            eased = funcs[0](p)
+        else:
+            eased = np.empty_like(p)
+            codes = self._easing_codes
+            for code, f in enumerate(funcs):
+                mask = codes == code
+                if mask.any():
+                    eased[mask] = f(p[mask])
+        values = self._start + self._delta * eased[self._elem_track]
+
+        # write back
+        strs = list(map('%.10g'.__mod__, values.tolist()))
+        offsets = self._offsets
+        lines = []
+        append = lines.append
+        join = ' '.join
+        n_cancelled = 0
+        for i, track in enumerate(tracks):
+            if track.cancelled:
+                n_cancelled += 1
+                continue
+            append(track._prefix + join(strs[offsets[i]:offsets[i + 1]]))
+        if lines:
+            self._eval('\n'.join(lines))
+
+        # retire the finished ones
+        done = p >= 1.
+        n_finished = int(np.count_nonzero(done))
+        if n_finished or n_cancelled:
+            self._retire(done)
+
+    def _retire(self, done):
+        np = self._np
+        tracks = self._tracks
+        keep = ~done
+        retired = []
+        for i, track in enumerate(tracks):
+            if track.cancelled:
+                keep[i] = False
+                retired.append(track)
+            elif done[i]:
+                track.finished = True
+                retired.append(track)
+
+        sizes = np.diff(self._offsets)[keep]
+        elem_keep = keep[self._elem_track]
+        new_index = np.cumsum(keep) - 1
+        self._tracks = [t for t, k in zip(tracks, keep.tolist()) if k]
+        self._t0 = self._t0[keep]
+        self._inv_duration = self._inv_duration[keep]
+        self._easing_codes = self._easing_codes[keep]
+        self._offsets = [0, *np.cumsum(sizes).tolist()]
+        self._start = self._start[elem_keep]
+        self._delta = self._delta[elem_keep]
+        self._elem_track = new_index[self._elem_track[elem_keep]]
+
+        if not (self._tracks or self._new_tracks):
+            self._clock_event.cancel()
+            self._clock_event = None
+        for track in retired:
+            track._resume_waiting_tasks()
@@ -0,0 +1,101 @@
+__all__ = ('run_in_asyncio', 'get_asyncio_loop', )
+
+from functools import partial
+from threading import Thread
+from collections.abc import Awaitable
+
+from asyncgui import Cancelled, ExclusiveEvent, current_task, sleep_forever
+
+from ._tkinter_stuffs import Clock, _wait_for_thread, _fire_threadsafe
+
+
+class _AsyncioThread:
+    '''An asyncio event loop running in a dedicated thread.'''
+    def __init__(self):
+        # Imported here because importing asyncio takes about as long as importing the rest of asynctkinter.
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self._run, daemon=True, name="asynctkinter.asyncio")
+        self._thread.start()
+
+    def _run(self):
+        import asyncio
+        loop = self.loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+    def close(self):
+        '''Cancels the remaining asyncio tasks, stops the loop, and waits for the thread to end.'''
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
+def get_asyncio_loop(clock: Clock) -> 'asyncio.AbstractEventLoop':
+    '''
+    Returns the asyncio event loop that :func:`run_in_asyncio` uses, starting it in a dedicated thread if it hasn't
+    been started yet. It can be used for scheduling things that are not awaited by any task, such as
+    :func:`asyncio.run_coroutine_threadsafe`.
+
+    If the ``clock`` is the one :func:`run` created, the loop is stopped when :func:`run` returns. Otherwise, it keeps
+    running until the program exits.
+
+    .. versionadded:: 0.6.0
+    '''
+    if (t := getattr(clock, '_asyncio_thread', None)) is None:
+        clock._asyncio_thread = t = _AsyncioThread()
+    return t.loop
+
+
+async def _await(aw):
+    return await aw
+
+
+async def run_in_asyncio(clock: Clock, aw: Awaitable, *, polling_interval=1.0):
+    '''
+    Runs an asyncio awaitable, such as a coroutine from an asyncio-based library, in the asyncio event loop returned
+    by :func:`get_asyncio_loop`, and waits for it to complete.
+
+    .. code-block::
+
+        async def fetch(url):
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url) as response:
+                    return await response.text()
+
+        text = await atk.run_in_asyncio(clock, fetch("https://example.com"))
+
+    The asyncio code runs in another thread, so it must not touch any widget. Asyncio constructs such as the
+    ``async with`` above cannot be used directly in asynctkinter tasks; wrap them in a coroutine function instead.
+
+    Cancellation propagates both ways: cancelling the caller task cancels the asyncio task, and if the asyncio task
+    gets cancelled, the caller task gets cancelled as well.
+
+    If the ``clock`` is the one :func:`run` created, the asyncio thread wakes the caller up as soon as ``aw``
+    completes. Otherwise, the completion is checked every ``polling_interval`` seconds.
+
+    .. versionadded:: 0.6.0
+    '''
+    import asyncio
+    loop = get_asyncio_loop(clock)
+    future = asyncio.run_coroutine_threadsafe(aw if asyncio.iscoroutine(aw) else _await(aw), loop)
+    wakeup = clock._thread_wakeup if isinstance(clock, Clock) else None
+    ee = ExclusiveEvent()
+    if wakeup is not None:
+        future.add_done_callback(partial(_fire_threadsafe, wakeup.call_soon_threadsafe, ee.fire))
+    try:
+        await _wait_for_thread(clock, wakeup, ee, future.done, polling_interval)
+    except Cancelled:
+        future.cancel()
+        raise
+    if future.cancelled():
+        (await current_task()).cancel()
+        await sleep_forever()
+    return future.result()
@@ -0,0 +1,122 @@
+__all__ = ('CanvasBatcher', 'get_canvas_batcher', )
+
+import tkinter
+from itertools import chain
+from tkinter import _join, _flatten
+
+from ._tkinter_stuffs import Clock, bind, unbind
+
+
+class CanvasBatcher:
+    '''
+    Records ``coords()``, ``move()`` and ``itemconfig()`` calls on a :class:`tkinter.Canvas` and sends them to Tcl as
+    a single script once per frame, right before Tk gets to redraw. Only the last value for each item/option pair
+    survives, so the Tcl cost per frame depends on the number of items that changed, not on the number of calls.
+
+    .. code-block::
+
+        batcher = get_canvas_batcher(clock, canvas)
+        async for s, e in clock.interpolate_seq((0, 0), (90, 180), duration=1):
+            batcher.itemconfig(arc, start=s, extent=e)
+
+    The flush is done by :func:`run`, so the ``clock`` must be the one it created. Otherwise, call :meth:`flush`
+    yourself. The canvas's own methods keep working, but they are not ordered with respect to the recorded calls.
+
+    .. versionadded:: 0.6.0
+    '''
+    __slots__ = ('canvas', '_clock', '_coords', '_moves', '_configs', '_scheduled', '__weakref__', )
+
+    def __init__(self, clock: Clock, canvas: tkinter.Canvas):
+        self.canvas = canvas
+        self._clock = clock
+        self._coords = {}
+        self._moves = {}
+        self._configs = {}
+        self._scheduled = False
+
+    def _schedule_flush(self):
+        if not self._scheduled:
+            self._scheduled = True
+            self._clock._call_before_update(self.flush)
+
+    def coords(self, item, *args):
+        '''Same as :meth:`tkinter.Canvas.coords` except this one cannot be used to read the coordinates.'''
+        self._coords[item] = _flatten(args)
+        # The absolute coordinates override the moves recorded so far.
+        self._moves.pop(item, None)
+        self._schedule_flush()
+
+    def move(self, item, dx, dy):
+        '''Same as :meth:`tkinter.Canvas.move`. Consecutive moves of the same item are merged into one.'''
+        moves = self._moves
+        if (prev := moves.get(item)) is not None:
+            dx += prev[0]
+            dy += prev[1]
+        moves[item] = (dx, dy, )
+        self._schedule_flush()
+
+    def itemconfig(self, item, **options):
+        '''Same as :meth:`tkinter.Canvas.itemconfig` except this one cannot be used to read the options.'''
+        configs = self._configs
+        if (prev := configs.get(item)) is None:
+            configs[item] = options
+        else:
+            prev.update(options)
+        self._schedule_flush()
+
+    itemconfigure = itemconfig
+
+    def flush(self):
+        '''Sends the recorded calls to Tcl immediately.'''
+        self._scheduled = False
+        coords = self._coords
+        moves = self._moves
+        configs = self._configs
+        if not (coords or moves or configs):
+            return
+        canvas = self.canvas
+        path = canvas._w
+        to_options = canvas._options
+        script = '\n'.join(chain(
+            (_join((path, 'coords', item, *args, )) for item, args in coords.items()),
+            (_join((path, 'move', item, dx, dy, )) for item, (dx, dy) in moves.items()),
+            (_join((path, 'itemconfigure', item, *to_options(options), )) for item, options in configs.items()),
+        ))
+        coords.clear()
+        moves.clear()
+        configs.clear()
+        try:
+            canvas.tk.eval(script)
+        except tkinter.TclError:
+            if _is_alive(canvas):
+                raise
+            # The canvas has been destroyed. Nothing to update.
+
+
+def _is_alive(widget) -> bool:
+    try:
+        return bool(widget.winfo_exists())
+    except tkinter.TclError:
+        return False
+
+
+def get_canvas_batcher(clock: Clock, canvas: tkinter.Canvas) -> CanvasBatcher:
+    '''
+    Returns the :class:`CanvasBatcher` shared by all the tasks that draw on the ``canvas``, so that their calls end up
+    in the same Tcl script.
+
+    .. versionadded:: 0.6.0
+    '''
+    key = (clock, canvas, )
+    if (batcher := _shared_batchers.get(key)) is None:
+        batcher = _shared_batchers[key] = CanvasBatcher(clock, canvas)
+
+        def on_destroy(e):
+            if e.widget is canvas:
+                del _shared_batchers[key]
+                unbind(canvas, "<Destroy>", funcid)
+        funcid = bind(canvas, "<Destroy>", on_destroy, fields=('widget', ))
+    return batcher
+
+
+_shared_batchers: dict[tuple, CanvasBatcher] = {}
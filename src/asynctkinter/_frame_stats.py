@@ -0,0 +1,188 @@
+__all__ = ('FrameStats', 'FrameRecord', )
+
+from typing import NamedTuple
+from collections import deque
+from collections.abc import Callable
+from time import perf_counter, thread_time
+
+
+class FrameRecord(NamedTuple):
+    '''
+    What happened during a single iteration of the main loop. Times are in seconds.
+    '''
+
+    start: float
+    '''When the frame started, in :func:`time.perf_counter` time.'''
+
+    update_time: float
+    '''
+    Time spent processing Tk events, including the event handlers that resumed tasks, and redrawing. In event-driven
+    mode, this includes the processing of the event that ended the blocking, see :attr:`sleep_time`.
+    '''
+
+    tick_time: float
+    '''Time spent advancing the clock, i.e. running the tasks and callbacks that were due.'''
+
+    sleep_time: float
+    '''
+    Time spent sleeping, or blocking inside Tk in event-driven mode. In the latter case, Tk processes the event that
+    wakes it up, including any Python handler of it and the tasks the handler resumes, before returning. The CPU time
+    the main thread spends during the blocking is therefore counted as :attr:`update_time` instead, so that a slow
+    handler makes the frame slow. Time a handler spends waiting, e.g. on I/O, still counts as sleep.
+    '''
+
+    total_time: float
+    '''The length of the whole frame.'''
+
+    n_tk_events: int
+    '''The number of Tk events processed.'''
+
+    n_resumed: int
+    '''The number of clock callbacks (most of them being tasks) that the clock tick called.'''
+
+    slow: bool
+    '''Whether the time spent outside sleep exceeded the budget.'''
+
+    @property
+    def busy_time(self) -> float:
+        '''The time spent on anything but sleeping.'''
+        return self.total_time - self.sleep_time
+
+
+class FrameStats:
+    '''
+    Records how each iteration of the :func:`run`'s main loop spends its time, which tells you whether a stutter is
+    caused by Tk (``update_time``), by your own tasks (``tick_time``) or by oversleeping (``sleep_time``).
+
+    .. code-block::
+
+        stats = FrameStats(budget=1 / 60, on_slow_frame=print)
+        atk.run(main, stats=stats)
+        print(stats.summary())
+
+    Nothing is measured unless an instance is passed to :func:`run`; without it, the main loop runs exactly the same
+    code as before.
+
+    :param budget: The busy time a frame is allowed to take before it is flagged as slow. Defaults to the frame
+        interval of :func:`run`.
+    :param history: The number of recent frames kept in :attr:`frames`.
+    :param on_frame: Called with a :class:`FrameRecord` at the end of every frame.
+    :param on_slow_frame: Called with a :class:`FrameRecord` at the end of every slow frame.
+
+    .. versionadded:: 0.6.0
+    '''
+    def __init__(
+            self, *, budget=None, history=600,
+            on_frame: Callable[[FrameRecord], None]=None, on_slow_frame: Callable[[FrameRecord], None]=None):
+        self.budget = budget
+        self.frames: deque[FrameRecord] = deque(maxlen=history)
+        '''The most recent frames.'''
+        self.n_frames = 0
+        '''The total number of frames recorded.'''
+        self.n_slow_frames = 0
+        '''The total number of slow frames recorded.'''
+        self.on_frame = on_frame
+        self.on_slow_frame = on_slow_frame
+        self._reset_current_frame(None)
+
+    def _reset_current_frame(self, start):
+        self._start = start
+        self._update_time = 0.
+        self._tick_time = 0.
+        self._sleep_time = 0.
+        self._n_tk_events = 0
+        self._n_resumed = 0
+
+    def _end_frame(self, now):
+        total_time = now - self._start
+        slow = total_time - self._sleep_time > self.budget
+        record = FrameRecord(
+            self._start, self._update_time, self._tick_time, self._sleep_time, total_time,
+            self._n_tk_events, self._n_resumed, slow,
+        )
+        self.frames.append(record)
+        self.n_frames += 1
+        if (f := self.on_frame) is not None:
+            f(record)
+        if slow:
+            self.n_slow_frames += 1
+            if (f := self.on_slow_frame) is not None:
+                f(record)
+
+    def _instrument(self, clock, update_interval, root_update, clock_tick, wait):
+        '''
+        Returns instrumented versions of the three phases of the main loop. A frame ends when the next one starts
+        updating. ``root_update`` must return the number of Tk events it processed.
+        '''
+        if self.budget is None:
+            self.budget = update_interval
+        get_time = perf_counter
+        get_cpu_time = thread_time
+
+        def instrumented_update():
+            now = get_time()
+            if self._start is not None:
+                self._end_frame(now)
+            self._reset_current_frame(now)
+            try:
+                n = root_update()
+            finally:
+                self._update_time += get_time() - now
+            self._n_tk_events += n
+            return n
+
+        def instrumented_tick(dt):
+            self._n_resumed += clock._count_due_events(clock._cur_time + dt)
+            t = get_time()
+            clock_tick(dt)
+            self._tick_time += get_time() - t
+
+        def instrumented_wait(*args):
+            t = get_time()
+            cpu_t = get_cpu_time()
+            r = wait(*args)
+            elapsed = get_time() - t
+            # Blocking inside Tk uses no CPU time, while processing the event that ended the blocking does.
+            busy = min(get_cpu_time() - cpu_t, elapsed)
+            self._sleep_time += elapsed - busy
+            self._update_time += busy
+            if r:
+                # 'dooneevent()' processed an event.
+                self._n_tk_events += 1
+            return r
+
+        return instrumented_update, instrumented_tick, instrumented_wait
+
+    def histogram(self, bin_width=None) -> list[tuple[float, int]]:
+        '''
+        The distribution of the busy time of the recent frames, as a list of ``(lower_bound, count)`` pairs.
+        ``bin_width`` defaults to a quarter of the budget.
+        '''
+        frames = self.frames
+        if not frames:
+            return []
+        if bin_width is None:
+            bin_width = self.budget / 4.
+        counts = {}
+        for f in frames:
+            i = int(f.busy_time / bin_width)
+            counts[i] = counts.get(i, 0) + 1
+        return [(i * bin_width, counts.get(i, 0)) for i in range(max(counts) + 1)]
+
+    def summary(self) -> dict:
+        '''Averages and maximums of the recent frames.'''
+        frames = self.frames
+        n = len(frames)
+        if not n:
+            return {'n_frames': self.n_frames, 'n_slow_frames': self.n_slow_frames}
+        return {
+            'n_frames': self.n_frames,
+            'n_slow_frames': self.n_slow_frames,
+            'mean_update_time': sum(f.update_time for f in frames) / n,
+            'mean_tick_time': sum(f.tick_time for f in frames) / n,
+            'mean_sleep_time': sum(f.sleep_time for f in frames) / n,
+            'mean_busy_time': sum(f.busy_time for f in frames) / n,
+            'max_busy_time': max(f.busy_time for f in frames),
+            'mean_n_tk_events': sum(f.n_tk_events for f in frames) / n,
+            'mean_n_resumed': sum(f.n_resumed for f in frames) / n,
+        }
@@ -0,0 +1,260 @@
+__all__ = ('wait_readable', 'wait_writable', 'sock_connect', 'sock_recv', 'sock_sendall', )
+
+import os
+import types
+import socket
+from select import select
+from tkinter import READABLE, WRITABLE
+
+from asyncgui import _current_task, _sleep_forever
+
+from ._tkinter_stuffs import Clock
+
+
+class _FdWatcher:
+    '''
+    Keeps track of the tasks waiting for file descriptors to become ready, and of the mask each file descriptor is
+    being watched with.
+    '''
+    def __init__(self):
+        self._waiters = {}  # fd -> [readers, writers]
+        self._masks = {}  # fd -> the mask currently applied
+        self._ready = []  # the tasks '_on_ready()' is about to resume
+
+    def add(self, fd, is_write, task):
+        if (waiters := self._waiters.get(fd)) is None:
+            self._waiters[fd] = waiters = [[], []]
+        waiters[is_write].append(task)
+        self._update(fd)
+
+    def remove(self, fd, is_write, task):
+        if (waiters := self._waiters.get(fd)) is not None and task in (tasks := waiters[is_write]):
+            tasks.remove(task)
+            self._update(fd)
+        elif task in (ready := self._ready):
+            # '_on_ready()' has picked the task, but another task it resumed has cancelled this one.
+            ready[ready.index(task)] = None
+
+    def _update(self, fd):
+        readers, writers = self._waiters[fd]
+        mask = (READABLE if readers else 0) | (WRITABLE if writers else 0)
+        if mask == self._masks.get(fd, 0):
+            if not mask:
+                del self._waiters[fd]
+            return
+        if mask:
+            self._masks[fd] = mask
+        else:
+            self._masks.pop(fd, None)
+            del self._waiters[fd]
+        self._apply(fd, mask)
+
+    def _on_ready(self, fd, readable, writable):
+        if (waiters := self._waiters.get(fd)) is None:
+            return
+        ready = []
+        if readable and waiters[0]:
+            ready.extend(waiters[0])
+            waiters[0] = []
+        if writable and waiters[1]:
+            ready.extend(waiters[1])
+            waiters[1] = []
+        self._ready = ready
+        try:
+            for i, task in enumerate(ready):
+                if task is not None:
+                    ready[i] = None
+                    task._step()
+        finally:
+            self._ready = []
+        # The resumed tasks are likely to have waited again, in which case the mask stays the same.
+        if fd in self._waiters:
+            self._update(fd)
+
+    def _apply(self, fd, mask):
+        raise NotImplementedError
+
+
+class _TkFdWatcher(_FdWatcher):
+    '''
+    Lets Tk watch the file descriptors, so that the main loop wakes up as soon as one of them becomes ready. The tasks
+    are resumed by the main loop, not by Tk, because :mod:`tkinter` silently discards exceptions raised in file
+    handlers.
+    '''
+    def __init__(self, tk, call_soon):
+        super().__init__()
+        self._tk = tk
+        self._call_soon = call_soon
+
+    def _apply(self, fd, mask):
+        if mask:
+            self._tk.createfilehandler(fd, mask, self._on_tk_file_event)
+        else:
+            self._tk.deletefilehandler(fd)
+
+    def _on_tk_file_event(self, fd, mask):
+        # Stops watching until the main loop has resumed the tasks, otherwise Tk would keep reporting the same
+        # readiness. '_on_ready()' watches the file descriptor again if anyone is still waiting for it.
+        self._tk.deletefilehandler(fd)
+        del self._masks[fd]
+        self._call_soon(self._on_ready, fd, mask & READABLE, mask & WRITABLE)
+
+
+class _SelectFdWatcher(_FdWatcher):
+    '''
+    Checks the file descriptors with :func:`select.select` on every frame, for platforms where
+    :meth:`tkinter.Tk.createfilehandler` is not available and for clocks not driven by :func:`run`.
+    '''
+    def __init__(self, clock):
+        super().__init__()
+        self._clock = clock
+        self._clock_event = None
+
+    def _apply(self, fd, mask):
+        if self._masks:
+            if self._clock_event is None:
+                self._clock_event = self._clock.schedule_interval(self._poll, 0)
+        elif self._clock_event is not None:
+            self._clock_event.cancel()
+            self._clock_event = None
+
+    def _poll(self, dt):
+        masks = self._masks
+        rlist = [fd for fd, mask in masks.items() if mask & READABLE]
+        wlist = [fd for fd, mask in masks.items() if mask & WRITABLE]
+        rlist, wlist, xlist = select(rlist, wlist, rlist, 0)
+        ready = {}
+        for fd in rlist:
+            ready[fd] = READABLE
+        for fd in xlist:
+            ready[fd] = READABLE
+        for fd in wlist:
+            ready[fd] = ready.get(fd, 0) | WRITABLE
+        on_ready = self._on_ready
+        for fd, mask in ready.items():
+            on_ready(fd, mask & READABLE, mask & WRITABLE)
+
+
+def _get_fd_watcher(clock: Clock) -> _FdWatcher:
+    if (watcher := getattr(clock, '_fd_watcher', None)) is None:
+        tk = getattr(clock, '_tk', None)
+        wakeup = getattr(clock, '_thread_wakeup', None)
+        if tk is not None and wakeup is not None and hasattr(tk, 'createfilehandler'):
+            watcher = _TkFdWatcher(tk, wakeup.call_soon)
+        else:
+            watcher = _SelectFdWatcher(clock)
+        clock._fd_watcher = watcher
+    return watcher
+
+
+def _fileno(fd) -> int:
+    return fd if isinstance(fd, int) else fd.fileno()
+
+
+@types.coroutine
+def _wait_fd(clock, fd, is_write):
+    watcher = _get_fd_watcher(clock)
+    fd = _fileno(fd)
+    task = (yield _current_task)[0][0]
+    watcher.add(fd, is_write, task)
+    try:
+        yield _sleep_forever
+    except BaseException:
+        # The task got cancelled.
+        watcher.remove(fd, is_write, task)
+        raise
+
+
+def wait_readable(clock: Clock, fd):
+    '''
+    Waits until a file descriptor, or an object that has a ``fileno()`` method such as a socket, becomes readable.
+
+    .. code-block::
+
+        await atk.wait_readable(clock, sock)
+        data = sock.recv(4096)
+
+    No thread is involved. If the ``clock`` is the one :func:`run` created, Tk watches the file descriptor and wakes
+    the main loop up as soon as it becomes ready. Otherwise, or where :meth:`tkinter.Tk.createfilehandler` is not
+    available (Windows), it is checked with :func:`select.select` on every frame, which on Windows only works for
+    sockets.
+
+    .. versionadded:: 0.6.0
+    '''
+    return _wait_fd(clock, fd, False)
+
+
+def wait_writable(clock: Clock, fd):
+    '''
+    Waits until a file descriptor, or an object that has a ``fileno()`` method such as a socket, becomes writable.
+    See :func:`wait_readable` for details.
+
+    .. versionadded:: 0.6.0
+    '''
+    return _wait_fd(clock, fd, True)
+
+
+def _check_nonblocking(sock: socket.socket):
+    if sock.gettimeout() != 0:
+        raise ValueError("The socket must be in non-blocking mode. Call 'sock.setblocking(False)' first.")
+
+
+async def sock_connect(clock: Clock, sock: socket.socket, address):
+    '''
+    Connects a non-blocking socket to a remote address.
+
+    .. code-block::
+
+        sock = socket.socket()
+        sock.setblocking(False)
+        await atk.sock_connect(clock, sock, ('example.com', 80))
+
+    .. warning::
+        A host name in the ``address`` is resolved synchronously. Use :func:`socket.getaddrinfo` in
+        :func:`run_in_thread` beforehand if that can take long.
+
+    .. versionadded:: 0.6.0
+    '''
+    _check_nonblocking(sock)
+    try:
+        sock.connect(address)
+    except (BlockingIOError, InterruptedError):
+        pass
+    else:
+        return
+    await wait_writable(clock, sock)
+    if err := sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+        raise OSError(err, os.strerror(err))
+
+
+async def sock_recv(clock: Clock, sock: socket.socket, bufsize: int) -> bytes:
+    '''
+    Receives up to ``bufsize`` bytes from a non-blocking socket. Returns ``b''`` when the peer has closed the
+    connection.
+
+    .. versionadded:: 0.6.0
+    '''
+    _check_nonblocking(sock)
+    while True:
+        try:
+            return sock.recv(bufsize)
+        except (BlockingIOError, InterruptedError):
+            await wait_readable(clock, sock)
+
+
+async def sock_sendall(clock: Clock, sock: socket.socket, data):
+    '''
+    Sends all of the ``data`` to a non-blocking socket.
+
+    .. versionadded:: 0.6.0
+    '''
+    _check_nonblocking(sock)
+    view = memoryview(data).cast('B')
+    while view:
+        try:
+            n = sock.send(view)
+        except (BlockingIOError, InterruptedError):
+            n = 0
+        view = view[n:]
+        if view:
+            await wait_writable(clock, sock)
@@ -0,0 +1,298 @@
+__all__ = ('run_in_process', )
+
+import os
+import types
+import traceback
+from typing import NamedTuple
+from collections import deque
+
+from asyncgui import _current_task, _sleep_forever
+
+from ._tkinter_stuffs import Clock
+from ._io import wait_readable
+
+
+_SHM_THRESHOLD = 64 * 1024
+'''Byte strings and NumPy arrays at least this large are passed through shared memory instead of being pickled.'''
+
+
+class _SharedBytes(NamedTuple):
+    name: str
+    size: int
+    type: type
+
+
+class _SharedArray(NamedTuple):
+    name: str
+    shape: tuple
+    dtype: str
+
+
+def _is_ndarray(obj) -> bool:
+    cls = type(obj)
+    return cls.__name__ == 'ndarray' and cls.__module__ == 'numpy'
+
+
+def _share(obj, shms: list):
+    '''
+    Copies ``obj`` into a new shared memory block and returns a descriptor of it, if it is worth doing so. Otherwise,
+    returns ``obj`` as is.
+    '''
+    if isinstance(obj, (bytes, bytearray)):
+        if (size := len(obj)) < _SHM_THRESHOLD:
+            return obj
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(create=True, size=size)
+        shms.append(shm)
+        shm.buf[:size] = obj
+        return _SharedBytes(shm.name, size, type(obj))
+    if _is_ndarray(obj):
+        if obj.nbytes < _SHM_THRESHOLD or obj.dtype.hasobject:
+            return obj
+        import numpy as np
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(create=True, size=obj.nbytes)
+        shms.append(shm)
+        np.ndarray(obj.shape, obj.dtype, buffer=shm.buf)[...] = obj
+        return _SharedArray(shm.name, obj.shape, obj.dtype.str)
+    return obj
+
+
+def _view(desc, shms: list):
+    '''The opposite of :func:`_share`, without copying NumPy arrays. Used in the worker processes.'''
+    if isinstance(desc, _SharedBytes):
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(desc.name)
+        shms.append(shm)
+        return desc.type(shm.buf[:desc.size])
+    if isinstance(desc, _SharedArray):
+        import numpy as np
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(desc.name)
+        shms.append(shm)
+        return np.ndarray(desc.shape, np.dtype(desc.dtype), buffer=shm.buf)
+    return desc
+
+
+def _take(desc):
+    '''The opposite of :func:`_share`, copying the data out of the shared memory block and releasing the block.'''
+    if isinstance(desc, _SharedBytes):
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(desc.name)
+        try:
+            return desc.type(shm.buf[:desc.size])
+        finally:
+            shm.close()
+            shm.unlink()
+    if isinstance(desc, _SharedArray):
+        import numpy as np
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(desc.name)
+        try:
+            return np.ndarray(desc.shape, np.dtype(desc.dtype), buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+    return desc
+
+
+def _unlink(desc):
+    '''Releases the shared memory block of a result that is not going to be taken.'''
+    if isinstance(desc, (_SharedBytes, _SharedArray)):
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(desc.name)
+        shm.close()
+        shm.unlink()
+
+
+def _close_shms(shms):
+    for shm in shms:
+        try:
+            shm.close()
+        except BufferError:
+            # The function kept a reference to the data.
+            pass
+
+
+class _RemoteTraceback(Exception):
+    def __init__(self, tb):
+        self.tb = tb
+
+    def __str__(self):
+        return self.tb
+
+
+def _worker_main(conn):
+    result_shms = []  # kept open until the parent has taken the result (required on Windows)
+    while (job := conn.recv()) is not None:
+        _close_shms(result_shms)
+        result_shms = []
+        func, args, kwargs = job
+        arg_shms = []
+        try:
+            args = [_view(a, arg_shms) for a in args]
+            kwargs = {k: _view(v, arg_shms) for k, v in kwargs.items()}
+            result = _share(func(*args, **kwargs), result_shms)
+            message = (True, result)
+        except BaseException as e:
+            message = (False, (e, traceback.format_exc()))
+        del args, kwargs, job
+        try:
+            conn.send(message)
+        except Exception:
+            # The exception or the result cannot be pickled.
+            conn.send((False, (RuntimeError(f"Could not send back {message[1]!r}"), traceback.format_exc())))
+        del message
+        result = None
+        _close_shms(arg_shms)
+
+
+class _Worker:
+    __slots__ = ('process', 'conn', )
+
+    def __init__(self, mp_context):
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=_worker_main, args=(child_conn, ), daemon=True, name="asynctkinter.run_in_process")
+        self.process.start()
+        child_conn.close()
+
+    def terminate(self):
+        self.process.terminate()
+        self.process.join()
+        conn = self.conn
+        # The process may have sent a result before it got terminated. If the result is in shared memory, nobody else
+        # is going to release it.
+        try:
+            while conn.poll():
+                succeeded, value = conn.recv()
+                if succeeded:
+                    _unlink(value)
+        except Exception:
+            # A message cut off in the middle, or one that cannot be unpickled.
+            pass
+        conn.close()
+
+
+class _ProcessPool:
+    '''
+    Worker processes that are started on demand, reused, and terminated individually when the task waiting for them
+    gets cancelled.
+    '''
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        import multiprocessing
+        self._mp_context = multiprocessing.get_context('spawn')
+        self._n_workers = 0
+        self._idle_workers = []
+        self._waiting_tasks = deque()
+
+    @types.coroutine
+    def acquire(self):
+        if self._idle_workers:
+            return self._idle_workers.pop()
+        if self._n_workers < self.max_workers:
+            self._n_workers += 1
+            try:
+                return _Worker(self._mp_context)
+            except BaseException:
+                self._n_workers -= 1
+                raise
+        task = (yield _current_task)[0][0]
+        self._waiting_tasks.append(task)
+        try:
+            return (yield _sleep_forever)[0][0]
+        except BaseException:
+            # The task got cancelled.
+            self._waiting_tasks.remove(task)
+            raise
+
+    def release(self, worker: _Worker):
+        if self._waiting_tasks:
+            self._waiting_tasks.popleft()._step(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def discard(self, worker: _Worker):
+        worker.terminate()
+        self._n_workers -= 1
+        if self._waiting_tasks:
+            # Someone is waiting for a worker, and now one can be started.
+            self._n_workers += 1
+            self._waiting_tasks.popleft()._step(_Worker(self._mp_context))
+
+    def close(self):
+        for worker in self._idle_workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._idle_workers:
+            worker.process.join(timeout=1.)
+            worker.terminate()
+        self._idle_workers.clear()
+
+
+def _get_process_pool(clock: Clock) -> _ProcessPool:
+    if (pool := getattr(clock, '_process_pool', None)) is None:
+        clock._process_pool = pool = _ProcessPool(os.cpu_count() or 1)
+    return pool
+
+
+async def _wait_for_message(clock, conn):
+    if os.name == 'nt':
+        # Pipe handles cannot be watched by Tk or 'select()' on Windows.
+        while not conn.poll():
+            await clock.sleep(0)
+    else:
+        await wait_readable(clock, conn)
+
+
+async def run_in_process(clock: Clock, func, /, *args, **kwargs):
+    '''
+    Runs ``func(*args, **kwargs)`` in another process, and waits for it to complete. Use it for CPU-bound work, which
+    would hold the GIL and freeze the UI if it ran in a thread.
+
+    .. code-block::
+
+        blurred = await atk.run_in_process(clock, gaussian_blur, image_array, sigma=3)
+
+    The ``func``, the arguments and the return value must be picklable, which means ``func`` has to be defined at the
+    top level of an importable module. Top-level arguments and return values that are large :class:`bytes`,
+    :class:`bytearray` or NumPy arrays are passed through shared memory instead. In the worker, such an array argument
+    is a view of the shared memory, not a copy, which ``func`` is free to modify.
+
+    The worker processes are started on demand using the ``'spawn'`` method, are reused, and number at most
+    :func:`os.cpu_count`. Further calls wait for a worker to become free. If the caller task is cancelled while its
+    ``func`` is running, the worker process is terminated. If the ``clock`` is the one :func:`run` created, the
+    workers are shut down when :func:`run` returns.
+
+    As with :mod:`multiprocessing`, the ``'spawn'`` method re-imports the main module in each worker, so the script
+    that calls :func:`run` must be guarded by ``if __name__ == '__main__':``.
+
+    .. versionadded:: 0.6.0
+    '''
+    pool = _get_process_pool(clock)
+    worker = await pool.acquire()
+    arg_shms = []
+    try:
+        args = [_share(a, arg_shms) for a in args]
+        kwargs = {k: _share(v, arg_shms) for k, v in kwargs.items()}
+        worker.conn.send((func, args, kwargs))
+        await _wait_for_message(clock, worker.conn)
+        succeeded, value = worker.conn.recv()
+    except BaseException as e:
+        pool.discard(worker)
+        if isinstance(e, EOFError):
+            raise RuntimeError("The worker process died unexpectedly.") from e
+        raise
+    else:
+        pool.release(worker)
+    finally:
+        for shm in arg_shms:
+            shm.close()
+            shm.unlink()
+    if succeeded:
+        return _take(value)
+    exc, tb = value
+    raise exc from _RemoteTraceback(tb)
@@ -0,0 +1,257 @@
+__all__ = ('TaskProfiler', 'ProfileEntry', )
+
+import os
+import json
+import threading
+from typing import NamedTuple
+from time import perf_counter
+
+import asyncgui
+from asyncgui import Task
+
+
+class ProfileEntry(NamedTuple):
+    '''
+    The accumulated cost of one (coroutine, awaited primitive) pair. Times are in seconds.
+    '''
+
+    task: str
+    '''The qualified name of the coroutine the task was started with.'''
+
+    awaited: str
+    '''What the task was waiting for before being resumed, e.g. ``'event'`` or ``'clock.sleep'``. ``'<start>'``
+    stands for the part of a task that runs before its first suspension.'''
+
+    n_resumptions: int
+
+    total_time: float
+    '''The time spent running the task, excluding the time spent running other tasks that it resumed.'''
+
+    max_time: float
+    '''The longest single resumption.'''
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.n_resumptions
+
+
+_AWAITED_LABELS = {
+    'event': 'event',
+    'ExclusiveEvent.wait_args_0': 'event_freq',  # what event_freq returns in its default mode
+    '_DeferredListener.wait': 'event_freq',
+    '_BatchingListener.wait': 'event_batch',
+    'Clock.sleep': 'clock.sleep',
+    'Clock.n_frames': 'clock.n_frames',
+    'run_in_thread': 'run_in_thread',
+    'run_in_executor': 'run_in_executor',
+    'AnimationTrack.__await__': 'AnimationTrack',
+    'async_generator_asend': 'async for',
+}
+
+
+def _qualname(obj) -> str:
+    try:
+        return obj.__qualname__
+    except AttributeError:
+        return type(obj).__qualname__
+
+
+def _describe(task: Task) -> tuple[str, str]:
+    '''Returns the name of the task's coroutine and what it is currently suspended at.'''
+    root_coro = task._root_coro
+    coro = root_coro.cr_await
+    if coro is None:
+        if (frame := root_coro.cr_frame) is None:
+            return _qualname(root_coro), '<finished>'
+        # not started yet
+        return _qualname(frame.f_locals.get('aw')), '<start>'
+    name = _qualname(coro)
+    labels = _AWAITED_LABELS
+    aw = coro
+    while True:
+        if (label := labels.get(_qualname(aw))) is not None:
+            return name, label
+        inner = getattr(aw, 'cr_await', None) or getattr(aw, 'gi_yieldfrom', None)
+        if inner is None:
+            return name, _qualname(aw)
+        aw = inner
+
+
+class TaskProfiler:
+    '''
+    Measures how much main-thread time each task consumes between its suspensions, grouped by the coroutine the task
+    was started with and by what the task was waiting for before being resumed.
+
+    .. code-block::
+
+        with TaskProfiler(trace=True) as profiler:
+            atk.run(main)
+        print(profiler.report())
+        profiler.dump_chrome_trace("trace.json")
+
+    While enabled, it replaces the methods that resume tasks (including :func:`asyncgui.start`) with measuring ones,
+    which makes every resumption noticeably slower. When disabled, nothing is left behind. Only one profiler can be
+    enabled at a time, and only the tasks resumed on the thread that enabled it are measured.
+
+    The time a task spends resuming other tasks, e.g. by firing an event they are waiting for, is attributed to those
+    tasks, not to itself.
+
+    :param trace: Whether to record every single resumption so that :meth:`dump_chrome_trace` can be used.
+    :param max_trace_events: The maximum number of resumptions recorded for the trace. The later ones are not.
+
+    .. versionadded:: 0.6.0
+    '''
+
+    _enabled_one = None
+
+    def __init__(self, *, trace=False, max_trace_events=1_000_000):
+        self.trace = trace
+        self.max_trace_events = max_trace_events
+        self._stats = {}  # (task, awaited) -> [n_resumptions, total_time, max_time]
+        self._trace_events = []
+        self._stack = []
+        self._originals = None
+        self._t0 = perf_counter()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *args):
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        return self._originals is not None
+
+    def enable(self):
+        if self._originals is not None:
+            return
+        if TaskProfiler._enabled_one is not None:
+            raise RuntimeError("Another TaskProfiler is already enabled.")
+        import asynctkinter
+        TaskProfiler._enabled_one = self
+        self._thread_id = threading.get_ident()
+        self._originals = originals = (Task._step, Task._throw_exc, Task._actual_cancel, asyncgui.start)
+        step, throw_exc, actual_cancel, start = originals
+        Task._step = self._wrap(step)
+        Task._throw_exc = self._wrap(throw_exc)
+        Task._actual_cancel = self._wrap(actual_cancel)
+        asyncgui.start = asynctkinter.start = self._wrap_start(start)
+
+    def disable(self):
+        if (originals := self._originals) is None:
+            return
+        import asynctkinter
+        Task._step, Task._throw_exc, Task._actual_cancel, asyncgui.start = originals
+        asynctkinter.start = originals[3]
+        self._originals = None
+        self._stack.clear()
+        TaskProfiler._enabled_one = None
+
+    def clear(self):
+        '''Discards everything measured so far.'''
+        self._stats.clear()
+        self._trace_events.clear()
+
+    def _measure(self, name, awaited, func, args, kwargs):
+        stack = self._stack
+        get_time = perf_counter
+        frame = [0.]  # the time spent in the tasks resumed by this one
+        stack.append(frame)
+        start = get_time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            inclusive = get_time() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += inclusive
+            exclusive = inclusive - frame[0]
+            key = (name, awaited)
+            if (s := self._stats.get(key)) is None:
+                self._stats[key] = [1, exclusive, exclusive]
+            else:
+                s[0] += 1
+                s[1] += exclusive
+                if s[2] < exclusive:
+                    s[2] = exclusive
+            if self.trace and len(events := self._trace_events) < self.max_trace_events:
+                events.append((name, awaited, start, inclusive, exclusive))
+
+    def _wrap(self, original):
+        measure = self._measure
+        thread_id = self._thread_id
+        get_ident = threading.get_ident
+
+        def measuring_method(task, *args, **kwargs):
+            if get_ident() != thread_id:
+                return original(task, *args, **kwargs)
+            name, awaited = _describe(task)
+            return measure(name, awaited, original, (task, *args), kwargs)
+        return measuring_method
+
+    def _wrap_start(self, original):
+        measure = self._measure
+        thread_id = self._thread_id
+        get_ident = threading.get_ident
+
+        def start(aw, /):
+            if get_ident() != thread_id:
+                return original(aw)
+            name = _describe(aw)[0] if isinstance(aw, Task) else _qualname(aw)
+            return measure(name, '<start>', original, (aw, ), {})
+        start.__doc__ = original.__doc__
+        return start
+
+    def entries(self, *, sort_by='total_time') -> list[ProfileEntry]:
+        '''
+        The measurements, one per (coroutine, awaited primitive) pair, in descending order of ``sort_by``, which is
+        the name of any numeric attribute of :class:`ProfileEntry`.
+        '''
+        entries = [ProfileEntry(task, awaited, *s) for (task, awaited), s in self._stats.items()]
+        entries.sort(key=lambda e: getattr(e, sort_by), reverse=True)
+        return entries
+
+    def report(self, *, sort_by='total_time', limit=None) -> str:
+        '''Formats :meth:`entries` as a plain-text table.'''
+        entries = self.entries(sort_by=sort_by)[:limit]
+        if not entries:
+            return "No task has been resumed."
+        task_w = max(4, *(len(e.task) for e in entries))
+        awaited_w = max(7, *(len(e.awaited) for e in entries))
+        lines = [
+            f"{'task':<{task_w}}  {'awaited':<{awaited_w}}  {'count':>8}  {'total(ms)':>10}  {'mean(ms)':>9}  "
+            f"{'max(ms)':>9}",
+        ]
+        for e in entries:
+            lines.append(
+                f"{e.task:<{task_w}}  {e.awaited:<{awaited_w}}  {e.n_resumptions:>8}  {e.total_time * 1000.:>10.3f}  "
+                f"{e.mean_time * 1000.:>9.3f}  {e.max_time * 1000.:>9.3f}"
+            )
+        return '\n'.join(lines)
+
+    def chrome_trace(self) -> dict:
+        '''
+        The recorded resumptions in the Chrome Trace Event Format, which can be viewed in ``chrome://tracing`` or
+        `Perfetto <https://ui.perfetto.dev>`__. Requires ``trace=True``.
+        '''
+        pid = os.getpid()
+        tid = getattr(self, '_thread_id', 0)
+        t0 = self._t0
+        return {
+            'traceEvents': [
+                {
+                    'name': name, 'cat': awaited, 'ph': 'X', 'pid': pid, 'tid': tid,
+                    'ts': (start - t0) * 1e6, 'dur': inclusive * 1e6,
+                    'args': {'awaited': awaited, 'self_time_ms': exclusive * 1000.},
+                }
+                for name, awaited, start, inclusive, exclusive in self._trace_events
+            ],
+            'displayTimeUnit': 'ms',
+        }
+
+    def dump_chrome_trace(self, path):
+        '''Writes :meth:`chrome_trace` to a JSON file.'''
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
@@ -0,0 +1,264 @@
+__all__ = ('debounce', 'throttle', 'sample', )
+
+import types
+
+from ._tkinter_stuffs import Clock
+
+
+class _RateLimiter:
+    '''
+    Sits between a source that reports occurrences synchronously, such as a Tk binding or a variable trace, and a
+    consumer task, and limits the rate at which the consumer gets resumed according to the clock time.
+
+    * ``mode=None``: Every occurrence is delivered immediately.
+    * ``'debounce'``: An occurrence is delivered once no other occurrence has followed it for ``window`` seconds
+      (trailing), and/or the first occurrence after such a quiet period is delivered immediately (leading).
+    * ``'throttle'``: At most one occurrence is delivered per ``window`` seconds. The first one of a window is
+      delivered immediately (leading), and/or the latest one at the end of the window (trailing).
+    * ``'sample'``: The latest occurrence, if any, is delivered every ``window`` seconds.
+
+    An occurrence delivered while the consumer is not waiting is kept until it waits, the latest one replacing the
+    older ones. If a ``sink`` is given, occurrences are delivered to it instead of to a consumer task. Dropping an
+    occurrence only overwrites a reference, and the clock is rescheduled at most once per window, so the cost does not
+    grow with the rate of occurrences.
+    '''
+    __slots__ = (
+        '_clock', '_mode', '_window', '_leading', '_trailing', '_timer', '_latest', '_undelivered', '_last_time',
+        '_task', '_has_ready', '_ready', 'n_dropped', '_n_received', '_sink',
+    )
+
+    def __init__(self, clock, mode, window, *, leading=False, trailing=True, sink=None):
+        if mode not in (None, 'debounce', 'throttle', 'sample'):
+            raise ValueError(f"Unknown mode: {mode!r}")
+        if mode is not None and not (leading or trailing):
+            raise ValueError("At least one of 'leading' and 'trailing' must be True.")
+        self._clock = clock
+        self._mode = mode
+        self._window = window
+        self._leading = leading
+        self._trailing = trailing
+        self._timer = None
+        self._latest = None
+        self._undelivered = False
+        self._last_time = None
+        self._task = None
+        self._has_ready = False
+        self._ready = None
+        self.n_dropped = 0
+        '''The number of occurrences dropped before the one most recently delivered.'''
+        self._n_received = 0
+        self._sink = sink
+
+    def __call__(self, value):
+        self._n_received += 1
+        mode = self._mode
+        if mode is None:
+            self._deliver(value)
+            return
+        self._latest = value
+        if mode == 'debounce':
+            self._last_time = self._clock._cur_time
+            if self._timer is None:
+                self._timer = self._clock.schedule_interval(self._on_debounce_timer, self._window)
+                if self._leading:
+                    self._deliver(value)
+                    return
+            self._undelivered = True
+        elif mode == 'throttle':
+            if self._timer is None:
+                self._timer = self._clock.schedule_interval(self._on_throttle_timer, self._window)
+                if self._leading:
+                    self._deliver(value)
+                    return
+            self._undelivered = True
+        else:
+            self._undelivered = True
+            if self._timer is None:
+                self._timer = self._clock.schedule_interval(self._on_sample_timer, self._window)
+
+    def _on_debounce_timer(self, dt):
+        self._timer.cancel()
+        clock = self._clock
+        remaining = self._last_time + self._window - clock._cur_time
+        if remaining > 0:
+            # Something has occurred since the timer was started.
+            self._timer = clock.schedule_interval(self._on_debounce_timer, remaining)
+            return
+        self._timer = None
+        latest = self._latest
+        self._latest = None
+        if self._trailing and self._undelivered:
+            self._undelivered = False
+            self._deliver(latest)
+
+    def _on_throttle_timer(self, dt):
+        latest = self._latest
+        self._latest = None
+        if self._trailing and self._undelivered:
+            # The timer keeps running, and this starts a new window.
+            self._undelivered = False
+            self._deliver(latest)
+        else:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_sample_timer(self, dt):
+        latest = self._latest
+        self._latest = None
+        if self._undelivered:
+            self._undelivered = False
+            self._deliver(latest)
+        else:
+            self._timer.cancel()
+            self._timer = None
+
+    def _deliver(self, value):
+        n_dropped = self._n_received - 1
+        self._n_received = 0
+        if (sink := self._sink) is not None:
+            self.n_dropped = n_dropped
+            sink(value)
+            return
+        if (task := self._task) is None:
+            if self._has_ready:
+                # The one that has been waiting for the consumer gets replaced.
+                n_dropped += self.n_dropped + 1
+            self.n_dropped = n_dropped
+            self._has_ready = True
+            self._ready = value
+        else:
+            self.n_dropped = n_dropped
+            self._task = None
+            task._step(value)
+
+    def _attach_task(self, task):
+        self._task = task
+
+    @types.coroutine
+    def wait(self):
+        if self._has_ready:
+            value = self._ready
+            self._has_ready = False
+            self._ready = None
+            return value
+        try:
+            return (yield self._attach_task)[0][0]
+        finally:
+            self._task = None
+
+    def close(self):
+        if (timer := self._timer) is not None:
+            self._timer = None
+            timer.cancel()
+        self._latest = self._ready = None
+
+
+class _Operator:
+    _mode = None
+
+    def __init__(self, clock, stream, window, *, leading, trailing):
+        self.clock = clock
+        self.stream = stream
+        self.window = window
+        self.leading = leading
+        self.trailing = trailing
+
+    @property
+    def n_dropped(self) -> int:
+        '''The number of events dropped before the one most recently returned.'''
+        return self._limiter.n_dropped
+
+    def _subscribe(self, sink):
+        self._limiter = limiter = _RateLimiter(
+            self.clock, self._mode, self.window, leading=self.leading, trailing=self.trailing, sink=sink)
+        self.stream._subscribe(limiter)
+
+    def _unsubscribe(self):
+        self.stream._unsubscribe()
+        self._limiter.close()
+
+    def __enter__(self):
+        self._subscribe(None)
+        return self._limiter.wait
+
+    def __exit__(self, *args):
+        self._unsubscribe()
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *args):
+        return self.__exit__(*args)
+
+
+class debounce(_Operator):
+    '''
+    Rate-limits an :class:`event_freq` so that an event is returned only once no other event has followed it for
+    ``window`` seconds of ``clock`` time (``trailing``), and/or the first event after such a quiet period is returned
+    immediately (``leading``).
+
+    .. code-block::
+
+        with atk.debounce(clock, atk.event_freq(entry, "<KeyPress>"), 0.3) as typing_paused:
+            while True:
+                await typing_paused()
+                show_results(query(entry.get()))
+
+    The operators, :class:`debounce`, :class:`throttle` and :class:`sample`, can wrap one another, and all of them
+    share the Tk binding of the :class:`event_freq` they wrap with the other subscribers of the same event. An event
+    that gets dropped costs no more than overwriting a reference, and the clock gets rescheduled at most once per
+    window, no matter how fast the events arrive. As with :class:`event_freq`, the ``filter`` of the wrapped
+    :class:`event_freq` applies, while its ``coalesce`` does not. An event returned while the consumer is doing
+    something other than awaiting is kept until it awaits again, the latest one replacing the older ones.
+
+    .. versionadded:: 0.6.0
+    '''
+    _mode = 'debounce'
+
+    def __init__(self, clock: Clock, stream, window, *, leading=False, trailing=True):
+        super().__init__(clock, stream, window, leading=leading, trailing=trailing)
+
+
+class throttle(_Operator):
+    '''
+    Rate-limits an :class:`event_freq` so that at most one event is returned per ``window`` seconds of ``clock``
+    time: the first event of a window immediately (``leading``), and/or the latest event of the window once it ends
+    (``trailing``). A trailing event starts a new window.
+
+    .. code-block::
+
+        with atk.throttle(clock, atk.event_freq(root, "<Configure>"), 0.1) as resized:
+            while True:
+                await resized()
+                relayout()
+
+    See :class:`debounce` for what the operators have in common.
+
+    .. versionadded:: 0.6.0
+    '''
+    _mode = 'throttle'
+
+    def __init__(self, clock: Clock, stream, window, *, leading=True, trailing=True):
+        super().__init__(clock, stream, window, leading=leading, trailing=trailing)
+
+
+class sample(_Operator):
+    '''
+    Rate-limits an :class:`event_freq` so that the latest event, if any has arrived, is returned every ``window``
+    seconds of ``clock`` time.
+
+    .. code-block::
+
+        with atk.sample(clock, atk.event_freq(canvas, "<MouseWheel>"), 1 / 30) as wheel:
+            while True:
+                e = await wheel()
+                zoom(e.delta)
+
+    See :class:`debounce` for what the operators have in common.
+
+    .. versionadded:: 0.6.0
+    '''
+    _mode = 'sample'
+
+    def __init__(self, clock: Clock, stream, window):
+        super().__init__(clock, stream, window, leading=False, trailing=True)
@@ -1,16 +1,284 @@
 __all__ = (
-    'event', 'event_freq', 'run', 'install',
-    'run_in_thread', 'run_in_executor',
+    'Clock', 'event', 'event_freq', 'event_batch', 'event_any', 'event_any_freq', 'run', 'install', 'bind', 'unbind',
+    'run_in_thread', 'run_in_executor', 'checkpoint', 'wait_until_idle',
+    'iterate_in_thread', 'run_in_worker', 'CancellationToken',
 )
+import os
+import types
 from functools import lru_cache, partial
+from itertools import count
+from collections import deque, namedtuple
+from heapq import heappush, heappop, heapify
 from collections.abc import Awaitable
 
-from threading import Thread
-from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, Condition, Lock, Event as ThreadingEvent
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor, CancelledError
 import tkinter
+import _tkinter
 
-from asyncgui import Cancelled, ExclusiveEvent
-from asyncgui_ext.clock import Clock
+from asyncgui import Cancelled, ExclusiveEvent, _current_task, _sleep_forever
+import asyncgui_ext.clock
+
+from ._frame_stats import FrameStats
+
+
+class _ThreadWakeup:
+    '''
+    Lets other threads schedule function calls on the main thread.
+
+    On platforms where :meth:`tkinter.Tk.createfilehandler` is available, each call also writes a byte to a pipe that
+    Tk is watching, so the main loop wakes up immediately even when it is blocked inside Tk. Either way, the calls are
+    made by the main loop through :meth:`process`, not by Tk, because :mod:`tkinter` silently discards exceptions
+    raised in file handlers.
+    '''
+    def __init__(self, tk):
+        self._calls = deque()
+        self._tk = tk
+        self.n_waiting = 0
+        '''The number of tasks waiting for a call from another thread.'''
+        # Threads may outlive 'run()', so writing to the pipe and closing it must not interleave. Otherwise, a thread
+        # could write to an unrelated file that happened to reuse the file descriptor.
+        self._lock = Lock()
+        if hasattr(tk, 'createfilehandler'):
+            self._rfd, self._wfd = os.pipe()
+            os.set_blocking(self._rfd, False)
+            os.set_blocking(self._wfd, False)
+            tk.createfilehandler(self._rfd, tkinter.READABLE, self._on_readable)
+        else:
+            self._rfd = self._wfd = None
+
+    @property
+    def needs_polling(self) -> bool:
+        '''Whether the main loop has to poll because nothing would wake it up.'''
+        return self._wfd is None and self.n_waiting > 0
+
+    def call_soon_threadsafe(self, func, *args):
+        self._calls.append(partial(func, *args))
+        if self._wfd is None:
+            return
+        with self._lock:
+            if (wfd := self._wfd) is None:
+                # The main loop has already ended.
+                return
+            try:
+                os.write(wfd, b'\0')
+            except BlockingIOError:
+                # The pipe is full, which means the main thread is going to wake up anyway.
+                pass
+
+    def _on_readable(self, fd, mask):
+        # Only wakes the main loop up. The calls are made by the loop after Tk returns.
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def call_soon(self, func, *args):
+        '''
+        Schedules a function call the same way :meth:`call_soon_threadsafe` does, but from the main thread, which is
+        already awake.
+        '''
+        self._calls.append(partial(func, *args))
+
+    async def wait(self, ee: ExclusiveEvent):
+        '''
+        Waits for ``ee`` to be fired through :meth:`call_soon_threadsafe`, letting the main loop know that someone is
+        waiting in the meantime.
+        '''
+        self.n_waiting += 1
+        try:
+            await ee.wait()
+        finally:
+            self.n_waiting -= 1
+
+    def process(self):
+        calls = self._calls
+        popleft = calls.popleft
+        while calls:
+            popleft()()
+
+    def close(self):
+        if (rfd := self._rfd) is not None:
+            with self._lock:
+                wfd = self._wfd
+                self._rfd = self._wfd = None
+                os.close(wfd)
+            self._tk.deletefilehandler(rfd)
+            os.close(rfd)
+
+
+def _get_seq(entry):
+    return entry[1]
+
+
+class Clock(asyncgui_ext.clock.Clock):
+    '''
+    :class:`asyncgui_ext.clock.Clock` plus a few things :func:`run` needs in order to drive it.
+
+    Unlike its base class, which goes through every scheduled event on every :meth:`advance`, it keeps the events in a
+    heap ordered by their deadlines, so :meth:`advance` only touches the events that are due, and
+    :meth:`get_next_deadline` is cheap. As before, the events that are due are called in the order they were
+    scheduled, regardless of their deadlines, and an event scheduled during :meth:`advance` is not called until the
+    next one. The only difference is that an event scheduled during :meth:`advance` comes after all the events
+    scheduled before it, whereas the base class puts it right after the event whose callback scheduled it.
+
+    .. versionadded:: 0.6.0
+    '''
+
+    _thread_wakeup: _ThreadWakeup = None
+    _tk = None
+    _fd_watcher = None
+    _asyncio_thread = None
+    _process_pool = None
+    _worker_pool: ThreadPoolExecutor = None
+
+    max_workers: int = None
+    '''
+    The maximum number of threads :func:`run_in_worker` runs functions in. None means the default of
+    :class:`concurrent.futures.ThreadPoolExecutor`. It has to be set before the first call.
+    '''
+
+    frame_budget: float = None
+    '''
+    How long, in seconds, tasks may keep the main thread busy within a frame before :func:`checkpoint` suspends them.
+    :func:`run` sets it to half the frame interval. Feel free to change it.
+    '''
+
+    current_fps: float = None
+    '''
+    The rate, in frames per second, at which :func:`run` is currently driving the main loop. It varies when
+    :func:`run` is given a range of rates or runs in event-driven mode, where 0 means it is waiting for nothing but Tk
+    events.
+    '''
+
+    _frame_deadline = float('inf')
+
+    def __init__(self, initial_time=0):
+        super().__init__(initial_time)
+        self._heap = []  # [(deadline, seq, ClockEvent), ...] where 'seq' is fixed when the event gets scheduled
+        self._seq = count().__next__
+        self._advancing = False
+        self._events_scheduled_while_advancing = []
+        self._compaction_threshold = 64
+        self._before_update_callbacks = []
+        self._idle_waiters = deque()
+
+    def schedule_interval(self, func, interval) -> asyncgui_ext.clock.ClockEvent:
+        cur_time = self._cur_time
+        event = asyncgui_ext.clock.ClockEvent(cur_time + interval, cur_time, func, interval)
+        if self._advancing:
+            self._events_scheduled_while_advancing.append((self._seq(), event))
+        else:
+            heap = self._heap
+            heappush(heap, (event._deadline, self._seq(), event))
+            if len(heap) > self._compaction_threshold:
+                self._compact()
+        return event
+
+    schedule_interval.__doc__ = asyncgui_ext.clock.Clock.schedule_interval.__doc__
+
+    def _compact(self):
+        '''
+        Removes the cancelled events, which are otherwise left in the heap until they reach the top. The threshold
+        doubles each time, so the cost is amortized over the insertions.
+        '''
+        heap = self._heap
+        heap[:] = [entry for entry in heap if not entry[2]._cancelled]
+        heapify(heap)
+        self._compaction_threshold = max(64, len(heap) * 2)
+
+    def advance(self, delta_time):
+        self._cur_time += delta_time
+        cur_time = self._cur_time
+        heap = self._heap
+        due = []
+        append = due.append
+        while heap and heap[0][0] <= cur_time:
+            entry = heappop(heap)
+            if not entry[2]._cancelled:
+                append(entry)
+        # Like the base class, call the due events in the order they were scheduled, not in the order of deadlines.
+        due.sort(key=_get_seq)
+        self._advancing = True
+        try:
+            for __, seq, e in due:
+                if e._cancelled:
+                    continue
+                e.callback(cur_time - e._last_tick)
+                e._deadline += e._interval
+                e._last_tick = cur_time
+        finally:
+            self._advancing = False
+            for __, seq, e in due:
+                if not e._cancelled:
+                    heappush(heap, (e._deadline, seq, e))
+            if scheduled := self._events_scheduled_while_advancing:
+                self._events_scheduled_while_advancing = []
+                for seq, e in scheduled:
+                    heappush(heap, (e._deadline, seq, e))
+            if len(heap) > self._compaction_threshold:
+                self._compact()
+
+    advance.__doc__ = asyncgui_ext.clock.Clock.advance.__doc__
+    tick = advance
+
+    def _call_before_update(self, func):
+        '''
+        Makes :func:`run` call ``func`` once, after the next time it advances the clock and before Tk gets to redraw.
+        '''
+        self._before_update_callbacks.append(func)
+
+    def _process_before_update_callbacks(self):
+        if callbacks := self._before_update_callbacks:
+            self._before_update_callbacks = []
+            for func in callbacks:
+                func()
+
+    def _resume_idle_waiters(self, process_one_event, get_time=perf_counter):
+        '''
+        Resumes the tasks waiting in :func:`wait_until_idle`, one at a time, as long as the frame has budget left and
+        Tk has no event to process.
+        '''
+        waiters = self._idle_waiters
+        popleft = waiters.popleft
+        deadline = self._frame_deadline
+        while waiters and get_time() < deadline and not process_one_event():
+            popleft()._step()
+
+    def get_next_deadline(self):
+        '''
+        Returns the earliest time at which :meth:`advance` has something to do, or None if nothing is scheduled.
+        Events that want to be called on every frame (``step=0``) are treated as being due at :attr:`current_time`.
+        '''
+        heap = self._heap
+        while heap and heap[0][2]._cancelled:
+            heappop(heap)
+        if not heap:
+            return None
+        return heap[0][0]
+
+    def _count_due_events(self, time) -> int:
+        '''The number of events :meth:`advance` would call if it advanced the clock to ``time``.'''
+        heap = self._heap
+        n = 0
+        stack = [0] if heap else []
+        pop = stack.pop
+        push = stack.append
+        len_heap = len(heap)
+        while stack:
+            i = pop()
+            deadline, __, e = heap[i]
+            if deadline > time:
+                continue
+            if not e._cancelled:
+                n += 1
+            if (child := 2 * i + 1) < len_heap:
+                push(child)
+                if child + 1 < len_heap:
+                    push(child + 1)
+        return n
 
 
 def _event_callback(callback, filter, e: tkinter.Event):
@@ -18,19 +286,463 @@ def _event_callback(callback, filter, e: tkinter.Event):
         callback(e)
 
 
-async def event(widget, event_name, *, filter=None) -> Awaitable[tkinter.Event]:
+_EVENT_FIELDS = {
+    # name: Tcl substitution
+    'serial': '%#', 'num': '%b', 'focus': '%f', 'height': '%h', 'keycode': '%k', 'state': '%s', 'time': '%t',
+    'width': '%w', 'x': '%x', 'y': '%y', 'char': '%A', 'send_event': '%E', 'keysym': '%K', 'keysym_num': '%N',
+    'widget': '%W', 'type': '%T', 'x_root': '%X', 'y_root': '%Y', 'delta': '%D',
+}
+
+
+def _getint_event(s):
+    try:
+        return int(s)
+    except ValueError:
+        return s
+
+
+def _getint_or_zero(s):
+    try:
+        return int(s)
+    except ValueError:
+        return 0
+
+
+def _get_event_type(s):
+    try:
+        return tkinter.EventType(s)
+    except ValueError:
+        return s
+
+
+@lru_cache(maxsize=None)
+def _event_record_type(fields: tuple[str]):
+    return namedtuple('EventRecord', fields)
+
+
+def _make_substitute(widget, fields: tuple[str]):
+    '''
+    Returns a function that converts the Tcl substitutions of the given fields into an ``EventRecord``, the same way
+    :meth:`tkinter.Misc._substitute` converts all of them into a :class:`tkinter.Event`.
+    '''
+    getboolean = widget.tk.getboolean
+
+    def getboolean_event(s):
+        try:
+            return getboolean(s)
+        except tkinter.TclError:
+            return s
+
+    def nametowidget_event(s):
+        try:
+            return widget._nametowidget(s)
+        except KeyError:
+            return s
+
+    converters = {
+        'focus': getboolean_event, 'send_event': getboolean_event, 'char': None, 'keysym': None,
+        'widget': nametowidget_event, 'type': _get_event_type, 'delta': _getint_or_zero,
+    }
+    converters = tuple(converters.get(name, _getint_event) for name in fields)
+    make_record = _event_record_type(fields)._make
+    zip_ = zip
+
+    def substitute(*args):
+        return (make_record([a if c is None else c(a) for c, a in zip_(converters, args)]), )
+    return substitute
+
+
+def _normalize_fields(fields) -> tuple[str] | None:
+    if fields is None:
+        return None
+    fields = tuple(fields)
+    for name in fields:
+        if name not in _EVENT_FIELDS:
+            raise ValueError(f"Unknown event field: {name!r}. Available ones are: {', '.join(_EVENT_FIELDS)}")
+    return fields
+
+
+class _EventDispatcher:
+    '''
+    Owns the one and only Tcl binding that asynctkinter installs for a (widget, sequence, fields) triple, and forwards
+    the events to any number of Python-side listeners. The binding is installed when the first listener is added, and
+    removed only if there are still no listeners when Tk becomes idle after the last one left. A task that awaits the
+    same event in a loop therefore keeps reusing the binding, and adding or removing a listener costs a dict
+    operation instead of Tcl round trips.
+    '''
+    __slots__ = ('widget', 'sequence', 'fields', 'listeners', 'uninstall_pending', '_funcid', '_script', )
+
+    def __init__(self, widget, sequence, fields):
+        self.widget = widget
+        self.sequence = sequence
+        self.fields = fields
+        self.listeners = {}
+        self.uninstall_pending = False
+        if fields is None:
+            subst = widget._substitute
+            subst_format_str = widget._subst_format_str
+        else:
+            subst = _make_substitute(widget, fields)
+            subst_format_str = ' '.join(_EVENT_FIELDS[name] for name in fields)
+        self._funcid = funcid = widget._register(self.dispatch, subst)
+        self._script = script = f'if {{"[{funcid} {subst_format_str}]" == "break"}} break\n'
+        widget.tk.call('bind', widget._w, sequence, '+' + script)
+
+    def dispatch(self, e: tkinter.Event):
+        listeners = self.listeners
+        # A listener may add or remove listeners, including itself, while being called.
+        for key, listener in tuple(listeners.items()):
+            if key in listeners and listener(e) == "break":
+                return "break"
+
+    def uninstall(self):
+        '''
+        Removes the Tcl binding. Unlike the patched :meth:`tkinter.Misc.unbind`, this doesn't need to split the bind
+        script into lines, because in most cases the binding is the only one for the sequence.
+        '''
+        widget = self.widget
+        call = widget.tk.call
+        path = widget._w
+        sequence = self.sequence
+        script = self._script
+        try:
+            current = call('bind', path, sequence)
+            if current == script:
+                call('bind', path, sequence, '')
+            else:
+                call('bind', path, sequence, current.replace(script, '', 1))
+            widget.deletecommand(self._funcid)
+        except tkinter.TclError:
+            # The widget has already been destroyed.
+            pass
+
+
+_dispatchers: dict[tuple, _EventDispatcher] = {}
+
+
+def _add_listener(widget, sequence, fields, listener, key=None) -> _EventDispatcher:
+    dkey = (widget, sequence, fields, )
+    if (d := _dispatchers.get(dkey)) is None:
+        d = _dispatchers[dkey] = _EventDispatcher(widget, sequence, fields)
+    d.listeners[listener if key is None else key] = listener
+    return d
+
+
+def _remove_listener(d: _EventDispatcher, key):
+    listeners = d.listeners
+    del listeners[key]
+    if listeners or d.uninstall_pending:
+        return
+    # Deferred, because the listener that just left is often about to be re-added, e.g. by
+    # 'while True: await event(...)'.
+    d.uninstall_pending = True
+    try:
+        d.widget.after_idle(_uninstall_if_unused, d)
+    except tkinter.TclError:
+        # The Tcl interpreter has already been deleted.
+        _uninstall_if_unused(d)
+
+
+def _uninstall_if_unused(d: _EventDispatcher):
+    d.uninstall_pending = False
+    if d.listeners:
+        return
+    del _dispatchers[(d.widget, d.sequence, d.fields, )]
+    d.uninstall()
+
+
+_funcid_counter = count()
+_funcid_to_dispatcher: dict[str, _EventDispatcher] = {}
+
+
+def bind(widget, sequence, func, *, fields=None) -> str:
+    '''
+    A faster alternative to ``widget.bind(sequence, func, "+")``.
+
+    .. code-block::
+
+        funcid = bind(widget, "<Motion>", on_motion)
+        ...
+        unbind(widget, "<Motion>", funcid)
+
+    All the callbacks bound to the same (widget, sequence) pair through this function share a single Tcl binding,
+    and the pair is tracked in a Python-side table. :func:`unbind` therefore removes a callback in constant time
+    instead of rewriting the Tcl bind script. Like in tkinter, a callback can return ``"break"`` to stop the event
+    from propagating any further.
+
+    See :func:`event` for the ``fields`` parameter.
+
+    .. versionadded:: 0.6.0
+    '''
+    funcid = f"asynctkinter{next(_funcid_counter)}"
+    _funcid_to_dispatcher[funcid] = _add_listener(widget, sequence, _normalize_fields(fields), func, funcid)
+    return funcid
+
+
+def unbind(widget, sequence, funcid):
+    '''
+    Removes a callback bound by :func:`bind`.
+
+    .. versionadded:: 0.6.0
+    '''
+    _remove_listener(_funcid_to_dispatcher.pop(funcid), funcid)
+
+
+async def event(widget, event_name, *, filter=None, fields=None) -> Awaitable[tkinter.Event]:
     '''
     .. code-block::
 
         e = await event(widget, "<ButtonPress>")
         print(f"{e.x = }, {e.y = }")
+
+    **Requesting only the fields you need**
+
+    By default, tkinter asks Tcl for 19 substitutions and converts every one of them into a :class:`tkinter.Event`,
+    even if you only read a couple of them. Pass ``fields`` to request only the ones you need; the event then arrives
+    as a lightweight named tuple that has only those attributes. This is worth it for frequent events, such as
+    ``<Motion>``.
+
+    .. code-block::
+
+        e = await event(widget, "<ButtonPress>", fields=("x", "y", "num"))
+        print(f"{e.x = }, {e.y = }, {e.num = }")
+
+    Available fields are the attributes of :class:`tkinter.Event`: ``serial``, ``num``, ``focus``, ``height``,
+    ``keycode``, ``state``, ``time``, ``width``, ``x``, ``y``, ``char``, ``send_event``, ``keysym``, ``keysym_num``,
+    ``widget``, ``type``, ``x_root``, ``y_root`` and ``delta``. The ``filter`` receives the same object the caller
+    does.
+
+    .. versionchanged:: 0.6.0
+        Added the ``fields`` parameter.
     '''
     ee = ExclusiveEvent()
-    bind_id = widget.bind(event_name, partial(_event_callback, ee.fire, filter), "+")
+    listener = partial(_event_callback, ee.fire, filter)
+    dispatcher = _add_listener(widget, event_name, _normalize_fields(fields), listener)
     try:
         return await ee.wait_args_0()
     finally:
-        widget.unbind(event_name, bind_id)
+        _remove_listener(dispatcher, listener)
+
+
+def _event_any_callback(callback, filter, index, e: tkinter.Event):
+    if filter is None or filter(e):
+        callback(index, e)
+
+
+def _add_any_listeners(sources, fields, fire) -> list[tuple[_EventDispatcher, partial]]:
+    subscriptions = []
+    try:
+        for index, (widget, event_name, *filter) in enumerate(sources):
+            listener = partial(_event_any_callback, fire, filter[0] if filter else None, index)
+            subscriptions.append((_add_listener(widget, event_name, fields, listener), listener))
+    except BaseException:
+        _remove_any_listeners(subscriptions)
+        raise
+    return subscriptions
+
+
+def _remove_any_listeners(subscriptions):
+    for dispatcher, listener in subscriptions:
+        _remove_listener(dispatcher, listener)
+
+
+async def event_any(*sources, fields=None) -> Awaitable[tuple[int, tkinter.Event]]:
+    '''
+    Waits for whichever of several events occurs first, and returns the index of its source along with the event.
+    Each source is a ``(widget, event_name)`` or ``(widget, event_name, filter)`` tuple.
+
+    .. code-block::
+
+        index, e = await event_any(
+            (ok_button, "<ButtonPress>"),
+            (cancel_button, "<ButtonPress>"),
+            (dialog, "<KeyPress>", lambda e: e.keysym == "Escape"),
+        )
+        accepted = index == 0
+
+    This is cheaper than racing one :func:`event` per source with :func:`asyncgui.wait_any`, as it does not create
+    any task. See :func:`event` for the ``fields`` parameter, which applies to all the sources.
+
+    .. versionadded:: 0.6.0
+    '''
+    ee = ExclusiveEvent()
+    subscriptions = _add_any_listeners(sources, _normalize_fields(fields), ee.fire)
+    try:
+        return (await ee.wait())[0]
+    finally:
+        _remove_any_listeners(subscriptions)
+
+
+class event_any_freq:
+    '''
+    The :class:`event_freq` version of :func:`event_any`.
+
+    .. code-block::
+
+        with event_any_freq((canvas, "<Motion>"), (canvas, "<B1-Motion>"), fields=("x", "y")) as moved:
+            while True:
+                index, e = await moved()
+                ...
+
+    .. versionadded:: 0.6.0
+    '''
+    def __init__(self, *sources, fields=None):
+        self.sources = sources
+        self.fields = _normalize_fields(fields)
+
+    def __enter__(self):
+        ee = ExclusiveEvent()
+        self._subscriptions = _add_any_listeners(self.sources, self.fields, ee.fire)
+        return ee.wait_args
+
+    def __exit__(self, *args):
+        _remove_any_listeners(self._subscriptions)
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *args):
+        return self.__exit__(*args)
+
+
+class _DeferredListener:
+    '''
+    Base class for listeners that store the events and hand them over to the waiting task once Tk has processed all
+    the pending events, so that the task gets resumed at most once per burst.
+    '''
+    __slots__ = ('filter', 'n_dropped', '_task', '_after_id', '_funcid', '_call', )
+
+    def __init__(self, widget, filter):
+        self.filter = filter
+        self.n_dropped = 0
+        self._task = None
+        self._after_id = None
+        self._call = widget.tk.call
+        self._funcid = widget._register(self._deliver)
+
+    def _schedule_delivery(self):
+        if self._after_id is None:
+            self._after_id = self._call('after', 'idle', self._funcid)
+
+    def _has_pending_events(self) -> bool:
+        raise NotImplementedError
+
+    def _deliver(self):
+        raise NotImplementedError
+
+    def _attach_task(self, task):
+        self._task = task
+        if self._has_pending_events():
+            self._schedule_delivery()
+
+    @types.coroutine
+    def wait(self):
+        try:
+            return (yield self._attach_task)[0][0]
+        finally:
+            self._task = None
+
+    def close(self, widget):
+        if (after_id := self._after_id) is not None:
+            self._after_id = None
+            self._call('after', 'cancel', after_id)
+        widget.deletecommand(self._funcid)
+
+
+class _CoalescingListener(_DeferredListener):
+    '''
+    Keeps only the latest event.
+    '''
+    __slots__ = ('_latest', '_n_received', )
+
+    def __init__(self, widget, filter):
+        super().__init__(widget, filter)
+        self._latest = None
+        self._n_received = 0
+
+    def __call__(self, e: tkinter.Event):
+        if (f := self.filter) is not None and not f(e):
+            return
+        self._latest = e
+        self._n_received += 1
+        if self._task is not None:
+            self._schedule_delivery()
+
+    def _has_pending_events(self):
+        return self._latest is not None
+
+    def _deliver(self):
+        self._after_id = None
+        if (task := self._task) is None or (e := self._latest) is None:
+            return
+        self.n_dropped = self._n_received - 1
+        self._latest = None
+        self._n_received = 0
+        task._step(e)
+
+
+class _BatchingListener(_DeferredListener):
+    '''
+    Keeps the events in a bounded buffer and hands all of them over at once.
+    '''
+    __slots__ = ('max_size', 'overflow', '_buffer', '_n_dropped', '_overflowed', )
+
+    def __init__(self, widget, filter, max_size, overflow):
+        if overflow not in ('drop_oldest', 'drop_newest', 'raise'):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        if max_size < 1:
+            raise ValueError(f"max_size must be 1 or greater. (was {max_size})")
+        super().__init__(widget, filter)
+        self.max_size = max_size
+        self.overflow = overflow
+        self._buffer = deque(maxlen=max_size if overflow == 'drop_oldest' else None)
+        self._n_dropped = 0
+        self._overflowed = False
+
+    def __call__(self, e: tkinter.Event):
+        if (f := self.filter) is not None and not f(e):
+            return
+        buffer = self._buffer
+        if len(buffer) == self.max_size:
+            self._n_dropped += 1
+            if self.overflow == 'drop_newest':
+                return
+            if self.overflow == 'raise':
+                self._overflowed = True
+                return
+            # 'drop_oldest': the deque discards the oldest one by itself.
+        buffer.append(e)
+        if self._task is not None:
+            self._schedule_delivery()
+
+    def _has_pending_events(self):
+        return bool(self._buffer)
+
+    def _deliver(self):
+        self._after_id = None
+        if (task := self._task) is None or not (buffer := self._buffer):
+            return
+        events = list(buffer)
+        buffer.clear()
+        self.n_dropped = self._n_dropped
+        self._n_dropped = 0
+        task._step(events)
+
+    @types.coroutine
+    def wait(self):
+        try:
+            events = (yield self._attach_task)[0][0]
+        finally:
+            self._task = None
+        if self._overflowed:
+            self._overflowed = False
+            exc = OverflowError(
+                f"More than {self.max_size} events arrived before the consumer caught up. "
+                f"{self.n_dropped} of them were dropped.")
+            # The events that did fit in the buffer must not be lost along with the ones that didn't.
+            exc.events = events
+            raise exc
+        return events
 
 
 class event_freq:
@@ -76,20 +788,57 @@ class event_freq:
                 e = await mouse_motion()
                 ...
 
+    **Coalescing**
+
+    If the events occur more often than the screen refreshes, as ``<Motion>`` does with high-polling-rate mice,
+    pass ``coalesce=True``. The events that arrive before the consumer gets resumed are then collapsed into the latest
+    one, which is handed over once Tk has processed all the pending events. The number of events that were dropped
+    in favor of the one most recently returned is available as :attr:`n_dropped`.
+
+    .. code-block::
+
+        ef = event_freq(canvas, "<Motion>", coalesce=True)
+        with ef as mouse_motion:
+            while True:
+                e = await mouse_motion()
+                print(ef.n_dropped, "events were dropped")
+
+    Unlike the default mode, events that arrive while the consumer is doing something other than awaiting
+    ``mouse_motion()`` are not lost; the latest of them is returned by the next ``await mouse_motion()``.
+
+    See :func:`event` for the ``fields`` parameter.
+
     .. versionadded:: 0.4.2
+
+    .. versionchanged:: 0.6.0
+        Added the ``coalesce`` and ``fields`` parameters.
     '''
-    def __init__(self, widget, event_name, *, filter=None):
+    def __init__(self, widget, event_name, *, filter=None, coalesce=False, fields=None):
         self.widget = widget
         self.event_name = event_name
         self.filter = filter
+        self.coalesce = coalesce
+        self.fields = _normalize_fields(fields)
+
+    @property
+    def n_dropped(self) -> int:
+        '''(coalescing mode only) The number of events dropped in favor of the one most recently returned.'''
+        return self._listener.n_dropped
 
     def __enter__(self):
+        if self.coalesce:
+            self._listener = listener = _CoalescingListener(self.widget, self.filter)
+            self._dispatcher = _add_listener(self.widget, self.event_name, self.fields, listener)
+            return listener.wait
         ee = ExclusiveEvent()
-        self.bind_id = self.widget.bind(self.event_name, partial(_event_callback, ee.fire, self.filter), "+")
+        self._listener = listener = partial(_event_callback, ee.fire, self.filter)
+        self._dispatcher = _add_listener(self.widget, self.event_name, self.fields, listener)
         return ee.wait_args_0
 
     def __exit__(self, *args):
-        self.widget.unbind(self.event_name, self.bind_id)
+        _remove_listener(self._dispatcher, self._listener)
+        if self.coalesce:
+            self._listener.close(self.widget)
 
     async def __aenter__(self):
         return self.__enter__()
@@ -97,6 +846,69 @@ class event_freq:
     async def __aexit__(self, *args):
         return self.__exit__(*args)
 
+    def _subscribe(self, sink):
+        '''Makes the events that pass the filter go to ``sink``. Used by the operators, such as :class:`debounce`.'''
+        self._listener = listener = partial(_event_callback, sink, self.filter)
+        self._dispatcher = _add_listener(self.widget, self.event_name, self.fields, listener)
+
+    def _unsubscribe(self):
+        _remove_listener(self._dispatcher, self._listener)
+
+
+class event_batch(event_freq):
+    '''
+    A variant of :class:`event_freq` for handlers that cannot afford to drop events but can process them in bulk,
+    such as stroke recording or key logging. Awaiting it returns a list of all the events that arrived since the
+    previous await, so the consumer gets resumed once per batch instead of once per event.
+
+    .. code-block::
+
+        with event_batch(canvas, "<B1-Motion>") as motion_batch:
+            while True:
+                events = await motion_batch()
+                canvas.create_line(*(c for e in events for c in (e.x, e.y)))
+
+    Events are delivered once Tk has processed all the pending events. The buffer holds at most ``max_size`` events,
+    and ``overflow`` decides what happens when it is full:
+
+    * ``'drop_oldest'`` (default): The oldest event in the buffer is discarded.
+    * ``'drop_newest'``: The incoming event is discarded.
+    * ``'raise'``: The incoming event is discarded, and the next await raises :exc:`OverflowError`. The batch that
+      would have been returned, which is everything the buffer held, is available as the ``events`` attribute of the
+      exception, so only the events that did not fit are lost.
+
+    .. code-block::
+
+        try:
+            events = await motion_batch()
+        except OverflowError as e:
+            events = e.events
+            ...
+
+    The number of events dropped before the most recent batch is available as :attr:`n_dropped`.
+    See :func:`event` for the ``fields`` parameter.
+
+    .. versionadded:: 0.6.0
+    '''
+    def __init__(self, widget, event_name, *, filter=None, max_size=1024, overflow='drop_oldest', fields=None):
+        super().__init__(widget, event_name, filter=filter, fields=fields)
+        self.max_size = max_size
+        self.overflow = overflow
+
+    @property
+    def n_dropped(self) -> int:
+        '''The number of events dropped before the most recent batch.'''
+        return self._listener.n_dropped
+
+    def __enter__(self):
+        self._listener = listener = _BatchingListener(self.widget, self.filter, self.max_size, self.overflow)
+        self._dispatcher = _add_listener(self.widget, self.event_name, self.fields, listener)
+        return listener.wait
+
+    def __exit__(self, *args):
+        _remove_listener(self._dispatcher, self._listener)
+        self._listener.close(self.widget)
+
 
 @lru_cache(maxsize=1)
 def install():
@@ -121,11 +933,56 @@ def install():
         tkinter.Misc.unbind = _new_unbind
 
 
-def run(async_fn, *, fps=20, root: tkinter.Tk=None):
+def run(async_fn, *, fps=20, root: tkinter.Tk=None, event_driven=False, stats: FrameStats=None):
+    '''
+    Creates a :class:`Clock` and a :class:`tkinter.Tk` (unless ``root`` is given), starts ``async_fn`` as the root
+    task, and drives both until the task ends or the window is closed.
+
+    .. code-block::
+
+        async def main(*, clock: atk.Clock, root: tk.Tk):
+            ...
+
+        atk.run(main)
+
+    :param fps: The rate at which the main loop polls Tk and advances the clock. In event-driven mode, this is the
+        maximum rate at which the clock advances while something is scheduled on every frame.
+
+        It can also be a ``(min_fps, max_fps)`` pair, in which case the loop runs at ``max_fps`` while something is
+        scheduled on every frame, such as an ongoing animation, or while Tk keeps receiving input, such as a drag,
+        and slows down to as low as ``min_fps`` while neither is the case. In polling mode, the loop never sleeps
+        past the next scheduled clock event, so timers stay accurate, but the first input event after a quiet period
+        may wait up to ``1 / min_fps`` seconds, after which the loop stays at ``max_fps`` until half a second has
+        passed without any. In event-driven mode, ``min_fps`` only puts a floor on how often the clock advances, and
+        can be 0 to disable it. The current rate is available as :attr:`Clock.current_fps`.
+
+        .. code-block::
+
+            atk.run(main, fps=(4, 60))
+    :param event_driven: If True, the main loop does not poll at a fixed rate. Instead, it blocks inside Tk until
+        either the next scheduled clock event is due or Tk has an event to process. An idle application uses
+        almost no CPU, and the latency of :func:`event` and :meth:`Clock.sleep` no longer depends on ``fps``.
+        Since signal handlers cannot run while Tk is blocking, it still wakes up a few times per second so that
+        Ctrl-C works.
+    :param stats: If given, records how each frame spends its time. See :class:`FrameStats`.
+
+    .. versionchanged:: 0.6.0
+        Added the ``event_driven`` and ``stats`` parameters, and ``fps`` accepts a range of rates.
+    '''
     from time import sleep, perf_counter as get_time
     from tkinter import TclError
     import asyncgui
-    from asyncgui_ext.clock import Clock
+
+    if isinstance(fps, tuple):
+        min_fps, max_fps = fps
+        if not (0 <= min_fps <= max_fps and max_fps > 0):
+            raise ValueError(f"'fps' must be a (min_fps, max_fps) pair with 0 <= min_fps <= max_fps. (got {fps})")
+        if min_fps == 0 and not event_driven:
+            raise ValueError("'min_fps' can be 0 only in event-driven mode.")
+        adaptive = True
+    else:
+        min_fps = max_fps = fps
+        adaptive = False
 
     install()
     max_ = max
@@ -136,65 +993,315 @@ def run(async_fn, *, fps=20, root: tkinter.Tk=None):
     # version 0.5 but they no longer are. In order not to break existing code, we need to recreate them.
     clock.run_in_thread = partial(run_in_thread, clock)
     clock.run_in_executer = partial(run_in_executor, clock)
+    clock._thread_wakeup = thread_wakeup = _ThreadWakeup(root.tk)
+    clock._tk = root.tk
 
     root_task = asyncgui.start(async_fn(clock=clock, root=root))
     root.protocol("WM_DELETE_WINDOW", lambda: (root_task.cancel(), root.destroy()))
 
     clock_tick = clock.tick
     root_update = root.update
-    update_interval = 1.0 / fps
+    process_calls_from_threads = thread_wakeup.process
+    process_before_update_callbacks = clock._process_before_update_callbacks
+    get_next_deadline = clock.get_next_deadline
+    idle_waiters = clock._idle_waiters
+    resume_idle_waiters = clock._resume_idle_waiters
+    process_one_event = partial(root.tk.dooneevent, _NON_IDLE_EVENTS)
+    update_interval = 1.0 / max_fps
+    max_interval = 1.0 / min_fps if min_fps else None
     min_sleep_time = 1.0 / 60.0
+    clock.frame_budget = update_interval * 0.5
+    clock.current_fps = max_fps
 
     STARTED = asyncgui.TaskState.STARTED
     last_time = get_time()
+    try:
+        if event_driven:
+            _run_event_driven(
+                root, clock, root_task, update_interval, max_interval if adaptive else None, last_time, stats)
+        else:
+            min_interval = update_interval
+            n_events = 0
+            last_input_time = -_INPUT_HOLD_TIME
+            if adaptive or stats is not None:
+                root_update = partial(_update_counting, process_one_event, root_update)
+            if stats is not None:
+                root_update, clock_tick, sleep = stats._instrument(
+                    clock, update_interval, root_update, clock_tick, sleep)
+            while root_task._state is STARTED:
+                frame_start = get_time()
+                clock._frame_deadline = frame_start + clock.frame_budget
+                try:
+                    n_events = root_update()
+                except TclError:
+                    break
+                process_calls_from_threads()
+
+                cur_time = get_time()
+                delta_time = cur_time - last_time
+                last_time = cur_time
+                clock_tick(delta_time)
+                process_before_update_callbacks()
+                if idle_waiters:
+                    resume_idle_waiters(process_one_event)
+                if adaptive:
+                    # The user is interacting with the app. Keep up with the input until it has stopped for a while,
+                    # otherwise the rate would fall back to 'min_fps' between two mouse motions.
+                    if n_events:
+                        last_input_time = cur_time
+                    if cur_time - last_input_time < _INPUT_HOLD_TIME:
+                        update_interval = min_interval
+                    else:
+                        update_interval = _adaptive_interval(clock, min_interval, max_interval)
+                    clock.current_fps = 1.0 / update_interval
+                    # 'delta_time' includes the previous sleep, which would make the intervals alternate between short
+                    # and long ones. Only the time spent in this frame is subtracted instead.
+                    sleep_time = max_(min_sleep_time, update_interval - (get_time() - frame_start))
+                else:
+                    sleep_time = max_(min_sleep_time, update_interval - delta_time)
+                deadline = get_next_deadline()
+                if deadline is not None and 0. < deadline - clock._cur_time < sleep_time:
+                    # Wakes up early so that the timer fires on time rather than up to a frame late.
+                    sleep_time = deadline - clock._cur_time
+                sleep(sleep_time)
+                # print(f"{last_time = }, {cur_time = }, {delta_time = }, {sleep_time = }")
+    finally:
+        # Runs even if an exception, such as KeyboardInterrupt, escapes from the loop. Otherwise, the threads and the
+        # processes would keep running, and the interpreter would hang at exit waiting for the worker threads.
+        try:
+            root_task.cancel()
+        finally:
+            thread_wakeup.close()
+            if (asyncio_thread := clock._asyncio_thread) is not None:
+                asyncio_thread.close()
+            if (process_pool := clock._process_pool) is not None:
+                process_pool.close()
+            if (worker_pool := clock._worker_pool) is not None:
+                worker_pool.shutdown(cancel_futures=True)
+
+
+def _do_nothing():
+    pass
+
+
+_NON_IDLE_EVENTS = (_tkinter.ALL_EVENTS & ~_tkinter.IDLE_EVENTS) | _tkinter.DONT_WAIT
+
+
+_INPUT_HOLD_TIME = 0.5
+'''How long, in seconds, the polling main loop keeps running at ``max_fps`` after Tk has received an event.'''
+
+
+def _update_counting(process_one_event, update) -> int:
+    '''Same as :meth:`tkinter.Misc.update` except this one returns the number of non-idle events processed.'''
+    n = 0
+    while process_one_event():
+        n += 1
+    update()
+    return n
+
+
+def _adaptive_interval(clock: Clock, min_interval, max_interval):
+    '''
+    The interval until the next frame, as long as possible without delaying the next scheduled clock event.
+    '''
+    if clock._idle_waiters:
+        return min_interval
+    deadline = clock.get_next_deadline()
+    if deadline is None:
+        return max_interval
+    interval = deadline - clock._cur_time
+    return min_interval if interval <= min_interval else min(interval, max_interval)
+
+
+_MAX_BLOCKING_TIME = 0.25
+'''The longest time, in seconds, the event-driven main loop blocks inside Tk before checking for signals.'''
+
+
+def _run_event_driven(root: tkinter.Tk, clock: Clock, root_task, update_interval, max_interval, last_time, stats):
+    from time import perf_counter as get_time
+    from math import ceil
+    from tkinter import TclError
+    import asyncgui
+
+    clock_tick = clock.tick
+    get_next_deadline = clock.get_next_deadline
+    root_update = root.update
+    thread_wakeup = clock._thread_wakeup
+    process_calls_from_threads = thread_wakeup.process
+    process_before_update_callbacks = clock._process_before_update_callbacks
+    dooneevent = root.tk.dooneevent
+    idle_waiters = clock._idle_waiters
+    resume_idle_waiters = clock._resume_idle_waiters
+    process_one_event = partial(dooneevent, _NON_IDLE_EVENTS)
+    tcl_call = root.tk.call
+    STARTED = asyncgui.TaskState.STARTED
+    max_fps = 1.0 / update_interval
+    if stats is not None:
+        root_update, clock_tick, dooneevent = stats._instrument(
+            clock, update_interval, partial(_update_counting, process_one_event, root_update), clock_tick, dooneevent)
+
     while root_task._state is STARTED:
+        clock._frame_deadline = get_time() + clock.frame_budget
         try:
             root_update()
         except TclError:
             break
+        process_calls_from_threads()
 
         cur_time = get_time()
-        delta_time = cur_time - last_time
+        clock_tick(cur_time - last_time)
         last_time = cur_time
-        sleep_time = max_(min_sleep_time, update_interval - delta_time)
-        clock_tick(delta_time)
-        sleep(sleep_time)
-        # print(f"{last_time = }, {cur_time = }, {delta_time = }, {sleep_time = }")
+        process_before_update_callbacks()
+        if idle_waiters:
+            resume_idle_waiters(process_one_event)
+        if root_task._state is not STARTED:
+            break
 
-    root_task.cancel()
+        deadline = get_next_deadline()
+        if idle_waiters:
+            # The idle waiters want to be resumed on the next frame.
+            deadline = clock._cur_time
+        timeout = None if deadline is None else deadline - clock._cur_time
+        if timeout is not None and timeout <= 0:
+            # Something wants to be called on every frame.
+            clock.current_fps = max_fps
+            timeout = last_time + update_interval - get_time()
+            if timeout <= 0:
+                continue
+        else:
+            if max_interval is not None:
+                timeout = max_interval if timeout is None else min(timeout, max_interval)
+            clock.current_fps = 0. if timeout is None else 1.0 / max(timeout, update_interval)
+        if thread_wakeup.needs_polling:
+            timeout = update_interval if timeout is None else min(timeout, update_interval)
+        # Python signal handlers, such as the one raising KeyboardInterrupt on Ctrl-C, cannot run while Tk is
+        # blocking, so it never blocks for long even when nothing is scheduled. The timer runs a Tcl script rather
+        # than a Python function, because the latter would run the signal handler and swallow the exception.
+        timeout = _MAX_BLOCKING_TIME if timeout is None else min(timeout, _MAX_BLOCKING_TIME)
+        after_id = tcl_call('after', ceil(timeout * 1000.), '')
+        dooneevent()
+        tcl_call('after', 'cancel', after_id)
 
 
-async def run_in_thread(clock: Clock, func, *, daemon=None, polling_interval=1.0):
+@types.coroutine
+def checkpoint(clock: Clock, _get_time=perf_counter):
     '''
-    Creates a new thread, runs a function within it, then waits for the completion of that function.
+    Suspends the current task until the next frame if the current frame has used up its
+    :attr:`Clock.frame_budget`. Otherwise, returns immediately. Use it in long-running loops on the main thread
+    instead of guessing where to put ``await clock.sleep(0)``.
 
     .. code-block::
 
-        return_value = await run_in_thread(clock, func)
+        for line in huge_log:
+            tree.insert("", "end", values=parse(line))
+            await atk.checkpoint(clock)
 
-    .. warning::
-        When the caller Task is cancelled, the ``func`` will be left running, which violates "structured concurrency".
+    It never suspends when the clock is not driven by :func:`run`.
+
+    .. versionadded:: 0.6.0
     '''
-    return_value = None
-    exception = None
-    done = False
+    if _get_time() >= clock._frame_deadline:
+        yield from clock.sleep(0)
+
+
+@types.coroutine
+def wait_until_idle(clock: Clock):
+    '''
+    Waits until :func:`run` finds a frame in which Tk has no event to process and the :attr:`Clock.frame_budget` is
+    not used up yet. Use it for background work on the main thread that must never compete with input handling, such
+    as warming caches or indexing.
+
+    .. code-block::
+
+        for row in offscreen_rows:
+            await atk.wait_until_idle(clock)
+            prerender(row)
 
-    def wrapper():
-        nonlocal return_value, done, exception
+    The waiting tasks are resumed one after another, in the order they started waiting, until the frame runs out of
+    budget or an event arrives. A task that waits again goes back to the end of the line, so it may be resumed
+    several times within a frame that has a lot of spare time.
+
+    .. versionadded:: 0.6.0
+    '''
+    task = (yield _current_task)[0][0]
+    waiters = clock._idle_waiters
+    waiters.append(task)
+    try:
+        yield _sleep_forever
+    except BaseException:
+        # The task got cancelled.
+        waiters.remove(task)
+        raise
+
+
+class _ThreadCall:
+    '''Calls a function in another thread, and keeps the outcome for the main thread.'''
+    __slots__ = ('_func', '_on_done', '_done', '_return_value', '_exception', )
+
+    def __init__(self, func, on_done=None):
+        self._func = func
+        self._on_done = on_done
+        self._done = False
+        self._return_value = None
+        self._exception = None
+
+    def __call__(self):
         try:
-            return_value = func()
+            self._return_value = self._func()
         except Exception as e:
-            exception = e
+            self._exception = e
         finally:
-            done = True
+            self._done = True
+            if (on_done := self._on_done) is not None:
+                on_done()
+
+    def is_done(self) -> bool:
+        return self._done
+
+    def result(self):
+        if (e := self._exception) is not None:
+            raise e
+        return self._return_value
 
-    Thread(target=wrapper, daemon=daemon, name="asynctkinter.run_in_thread").start()
-    async with clock.sleep_freq(polling_interval) as sleep:
-        while not done:
-            await sleep()
-    if exception is not None:
-        raise exception
-    return return_value
+
+async def _wait_for_thread(clock, wakeup: _ThreadWakeup | None, ee: ExclusiveEvent, is_done, polling_interval):
+    '''
+    Waits until ``is_done()`` returns True, either by polling it every ``polling_interval`` seconds or, if there is a
+    ``wakeup``, by waiting for the other thread to fire ``ee`` through it.
+    '''
+    if wakeup is None:
+        async with clock.sleep_freq(polling_interval) as sleep:
+            while not is_done():
+                await sleep()
+    else:
+        await wakeup.wait(ee)
+
+
+def _fire_threadsafe(call_soon_threadsafe, fire, future):
+    call_soon_threadsafe(fire)
+
+
+async def run_in_thread(clock: Clock, func, *, daemon=None, polling_interval=1.0):
+    '''
+    Creates a new thread, runs a function within it, then waits for the completion of that function.
+
+    .. code-block::
+
+        return_value = await run_in_thread(clock, func)
+
+    .. warning::
+        When the caller Task is cancelled, the ``func`` will be left running, which violates "structured concurrency".
+
+    .. versionchanged:: 0.6.0
+        If the ``clock`` is the one :func:`run` created, the thread wakes the caller up as soon as ``func`` returns,
+        and ``polling_interval`` is ignored.
+    '''
+    wakeup = clock._thread_wakeup if isinstance(clock, Clock) else None
+    ee = ExclusiveEvent()
+    call = _ThreadCall(func, None if wakeup is None else partial(wakeup.call_soon_threadsafe, ee.fire))
+    Thread(target=call, daemon=daemon, name="asynctkinter.run_in_thread").start()
+    await _wait_for_thread(clock, wakeup, ee, call.is_done, polling_interval)
+    return call.result()
 
 
 async def run_in_executor(clock: Clock, executer: ThreadPoolExecutor, func, *, polling_interval=1.0):
@@ -212,28 +1319,244 @@ async def run_in_executor(clock: Clock, executer: ThreadPoolExecutor, func, *, p
     .. warning::
         When the caller Task is cancelled, the ``func`` will be left running if it has already started,
         which violates "structured concurrency".
+
+    .. versionchanged:: 0.6.0
+        If the ``clock`` is the one :func:`run` created, the worker wakes the caller up as soon as ``func`` returns,
+        and ``polling_interval`` is ignored.
+    '''
+    wakeup = clock._thread_wakeup if isinstance(clock, Clock) else None
+    ee = ExclusiveEvent()
+    call = _ThreadCall(func, None if wakeup is None else partial(wakeup.call_soon_threadsafe, ee.fire))
+    future = executer.submit(call)
+    try:
+        await _wait_for_thread(clock, wakeup, ee, call.is_done, polling_interval)
+    except Cancelled:
+        future.cancel()
+        raise
+    return call.result()
+
+
+class CancellationToken:
     '''
-    return_value = None
-    exception = None
-    done = False
+    Tells a function running in :func:`run_in_worker` that the caller task has been cancelled, so that it can stop
+    early.
 
-    def wrapper():
-        nonlocal return_value, done, exception
-        try:
-            return_value = func()
-        except Exception as e:
-            exception = e
-        finally:
-            done = True
+    .. versionadded:: 0.6.0
+    '''
+    __slots__ = ('_event', )
+
+    def __init__(self):
+        self._event = ThreadingEvent()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        '''Raises :exc:`concurrent.futures.CancelledError` if the caller task has been cancelled.'''
+        if self._event.is_set():
+            raise CancelledError()
+
+    def sleep(self, duration) -> bool:
+        '''
+        Like :func:`time.sleep`, but returns as soon as the caller task gets cancelled. Returns whether it has been
+        cancelled.
+        '''
+        return self._event.wait(duration)
+
+    def _cancel(self):
+        self._event.set()
+
+
+def _get_worker_pool(clock: Clock) -> ThreadPoolExecutor:
+    if (pool := getattr(clock, '_worker_pool', None)) is None:
+        clock._worker_pool = pool = ThreadPoolExecutor(
+            max_workers=getattr(clock, 'max_workers', None), thread_name_prefix="asynctkinter.run_in_worker")
+    return pool
+
+
+async def run_in_worker(clock: Clock, func, *, polling_interval=1.0):
+    '''
+    Runs a function within a pool of threads owned by the ``clock``, and waits for the completion of the function.
+    The function receives a :class:`CancellationToken`, which it should check every now and then.
+
+    .. code-block::
+
+        def download(token: atk.CancellationToken):
+            with open(path, 'wb') as f:
+                for chunk in response.iter_content(65536):
+                    token.raise_if_cancelled()
+                    f.write(chunk)
+
+        await atk.run_in_worker(clock, download)
+
+    The threads are started on demand, up to :attr:`Clock.max_workers`, and are reused. Further calls are queued
+    until a thread becomes free. If the caller task is cancelled, a queued call never runs, and a running one gets
+    its token cancelled. If the ``clock`` is the one :func:`run` created, the pool is shut down when :func:`run`
+    returns, after cancelling the pending calls and waiting for the running ones, and the threads wake the caller up
+    as soon as the function returns, in which case ``polling_interval`` is ignored.
 
-    future = executer.submit(wrapper)
+    Unlike :func:`run_in_thread`, this does not create a thread per call, and unlike :func:`run_in_executor`, you
+    don't have to manage the executor.
+
+    .. versionadded:: 0.6.0
+    '''
+    token = CancellationToken()
+    future = _get_worker_pool(clock).submit(func, token)
+    wakeup = clock._thread_wakeup if isinstance(clock, Clock) else None
+    ee = ExclusiveEvent()
+    if wakeup is not None:
+        future.add_done_callback(partial(_fire_threadsafe, wakeup.call_soon_threadsafe, ee.fire))
     try:
-        async with clock.sleep_freq(polling_interval) as sleep:
-            while not done:
-                await sleep()
+        await _wait_for_thread(clock, wakeup, ee, future.done, polling_interval)
     except Cancelled:
+        token._cancel()
         future.cancel()
         raise
-    if exception is not None:
-        raise exception
-    return return_value
+    return future.result()
+
+
+class _ThreadStream:
+    '''
+    A bounded buffer between a generator running in a worker thread and the main thread. The producer blocks while
+    the buffer is full, and notifies the main thread only when it puts an item into a buffer that the main thread has
+    emptied, so the items arriving within a frame are delivered together.
+    '''
+    def __init__(self, max_size, notify):
+        self._buf = deque()
+        self._cond = Condition()
+        self._max_size = max_size
+        self._notify = notify
+        self._notified = False
+        self.stopped = False
+        self.done = False
+        self.exception = None
+
+    def produce(self, gen_func):
+        cond = self._cond
+        buf = self._buf
+        max_size = self._max_size
+        try:
+            it = gen_func()
+            try:
+                for item in it:
+                    with cond:
+                        while len(buf) >= max_size and not self.stopped:
+                            cond.wait()
+                        if self.stopped:
+                            return
+                        buf.append(item)
+                        needs_notification = not self._notified
+                        self._notified = True
+                    if needs_notification:
+                        self._notify()
+            finally:
+                if (close := getattr(it, 'close', None)) is not None:
+                    close()
+        except Exception as e:
+            self.exception = e
+        finally:
+            with cond:
+                self.done = True
+                needs_notification = not self._notified
+                self._notified = True
+            if needs_notification:
+                self._notify()
+
+    def take(self) -> list:
+        '''Removes and returns all the items in the buffer.'''
+        with self._cond:
+            items = list(self._buf)
+            self._buf.clear()
+            self._notified = False
+            self._cond.notify()
+        return items
+
+    def stop(self):
+        with self._cond:
+            self.stopped = True
+            self._cond.notify()
+
+
+class iterate_in_thread:
+    '''
+    Runs a generator function within a new thread, and lets you iterate over what it yields, as soon as it yields.
+
+    .. code-block::
+
+        def fetch_rows():
+            for row in cursor.execute(query):
+                yield row
+
+        async with atk.iterate_in_thread(clock, fetch_rows) as rows:
+            async for row in rows:
+                tree.insert("", "end", values=row)
+
+    The items travel through a buffer of ``max_size`` items. When the consumer falls behind and the buffer fills up,
+    the generator is paused until the consumer catches up. The items that arrive while the consumer is busy are
+    delivered together, without suspending the consumer in between.
+
+    Leaving the ``async with`` block, or cancelling the consumer, stops the generator the next time it yields, and
+    closes it within the worker thread. The ``async with`` can be omitted, in which case the generator is stopped when
+    the ``iterate_in_thread`` instance gets garbage-collected, e.g. right after breaking out of the ``async for``.
+    An exception raised by the generator is re-raised in the consumer after the items yielded before it.
+
+    If the ``clock`` is the one :func:`run` created, the thread wakes the consumer up as soon as an item is available.
+    Otherwise, the buffer is checked every ``polling_interval`` seconds.
+
+    .. versionadded:: 0.6.0
+    '''
+    def __init__(self, clock: Clock, gen_func, *, max_size=256, daemon=None, polling_interval=1.0):
+        self._clock = clock
+        self._polling_interval = polling_interval
+        self._items = deque()
+        self._wakeup = wakeup = clock._thread_wakeup if isinstance(clock, Clock) else None
+        if wakeup is None:
+            notify = _do_nothing
+        else:
+            self._ee = ee = ExclusiveEvent()
+            notify = partial(wakeup.call_soon_threadsafe, ee.fire)
+        self._stream = stream = _ThreadStream(max_size, notify)
+        Thread(target=stream.produce, args=(gen_func, ), daemon=daemon, name="asynctkinter.iterate_in_thread").start()
+
+    def __del__(self):
+        self._stream.stop()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self._stream.stop()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        items = self._items
+        if items:
+            return items.popleft()
+        stream = self._stream
+        while True:
+            if batch := stream.take():
+                items.extend(batch)
+                return items.popleft()
+            if stream.done:
+                # Items may have been added between 'take()' and here.
+                if batch := stream.take():
+                    items.extend(batch)
+                    return items.popleft()
+                if (e := stream.exception) is not None:
+                    stream.exception = None
+                    raise e
+                raise StopAsyncIteration
+            try:
+                await self._wait()
+            except BaseException:
+                stream.stop()
+                raise
+
+    async def _wait(self):
+        if (wakeup := self._wakeup) is None:
+            await self._clock.sleep(self._polling_interval)
+        else:
+            await wakeup.wait(self._ee)
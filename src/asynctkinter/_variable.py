@@ -0,0 +1,102 @@
+__all__ = ('var_write', 'var_write_freq', )
+
+import types
+import tkinter
+
+from asyncgui import ExclusiveEvent
+
+from ._tkinter_stuffs import Clock
+from ._rate_limit import _RateLimiter
+
+
+async def var_write(var: tkinter.Variable):
+    '''
+    Waits for a :class:`tkinter.Variable` to be written to, and returns its new value.
+
+    .. code-block::
+
+        text = await atk.var_write(entry_var)
+
+    .. versionadded:: 0.6.0
+    '''
+    ee = ExclusiveEvent()
+    cbname = var.trace_add('write', ee.fire)
+    try:
+        await ee.wait()
+    finally:
+        var.trace_remove('write', cbname)
+    return var.get()
+
+
+class var_write_freq:
+    '''
+    The :class:`event_freq` of :class:`tkinter.Variable`. Awaiting it returns the value of the variable after the next
+    write to it, which makes it react to input fields without polling their values.
+
+    .. code-block::
+
+        with atk.var_write_freq(search_var, clock=clock, debounce=0.3) as search_text_changed:
+            while True:
+                text = await search_text_changed()
+                show_results(query(text))
+
+    Unlike :class:`event_freq`, writes are not lost while the consumer is doing something other than awaiting; the
+    next await returns immediately with the latest value.
+
+    **Rate limiting**
+
+    * ``debounce``: Waits until the variable has not been written to for ``debounce`` seconds, so that typing into a
+      search box results in one query per pause instead of one per keystroke.
+    * ``throttle``: Returns at most once per ``throttle`` seconds: the first write of a period immediately, and the
+      latest write of the period once it ends.
+
+    Both are measured in ``clock`` time, so a ``clock`` is required when either of them is given. The number of writes
+    that have been folded into the most recently returned one is available as :attr:`n_dropped`.
+
+    .. note::
+
+        The value is read with :meth:`tkinter.Variable.get`, which raises :exc:`tkinter.TclError` if, for instance,
+        an :class:`tkinter.IntVar` holds a text that is not an integer.
+
+    .. versionadded:: 0.6.0
+    '''
+    def __init__(self, var: tkinter.Variable, *, clock: Clock=None, debounce=None, throttle=None):
+        if debounce is not None and throttle is not None:
+            raise ValueError("'debounce' and 'throttle' cannot be used together.")
+        if (debounce is not None or throttle is not None) and clock is None:
+            raise ValueError("A 'clock' is required for 'debounce' and 'throttle'.")
+        self.var = var
+        self.clock = clock
+        self.debounce = debounce
+        self.throttle = throttle
+
+    @property
+    def n_dropped(self) -> int:
+        '''The number of writes folded into the one most recently returned.'''
+        return self._limiter.n_dropped
+
+    def __enter__(self):
+        if self.debounce is not None:
+            limiter = _RateLimiter(self.clock, 'debounce', self.debounce)
+        elif self.throttle is not None:
+            limiter = _RateLimiter(self.clock, 'throttle', self.throttle, leading=True)
+        else:
+            limiter = _RateLimiter(self.clock, None, None)
+        self._limiter = limiter
+        self._cbname = self.var.trace_add('write', lambda *args: limiter(None))
+        return self._wait
+
+    @types.coroutine
+    def _wait(self):
+        yield from self._limiter.wait()
+        return self.var.get()
+
+    def __exit__(self, *args):
+        self.var.trace_remove('write', self._cbname)
+        self._limiter.close()
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *args):
+        return self.__exit__(*args)
@@ -0,0 +1,276 @@
+__all__ = ('VirtualList', )
+
+import tkinter
+from math import ceil
+from collections.abc import Sequence, AsyncIterable
+from tkinter import _join
+
+from ._tkinter_stuffs import Clock, event_any_freq
+from ._canvas import _is_alive
+
+
+class VirtualList:
+    '''
+    A list, or a table if ``columns`` is given, that can hold millions of rows. Only the rows within the viewport
+    are drawn, as text items on a :class:`tkinter.Canvas`, and those items are recycled as the view moves. Unlike
+    filling a :class:`tkinter.ttk.Treeview` or a :class:`tkinter.Listbox`, the memory and the time spent on drawing
+    therefore depend on the size of the viewport, not on the number of rows.
+
+    .. code-block::
+
+        vlist = VirtualList(clock, root, columns=(80, 160, 600), yscrollcommand=scrollbar.set)
+        scrollbar['command'] = vlist.yview
+        vlist.canvas.pack(side='left', fill='both', expand=True)
+
+        async with (
+            atk.run_as_daemon(vlist.handle_events()),
+            atk.iterate_in_thread(clock, fetch_rows) as rows,
+        ):
+            await vlist.feed(rows)
+            ...
+
+    **The rows**
+
+    The rows come from ``source``, which can be any :class:`collections.abc.Sequence`, and default to a new list.
+    Each row is converted with :class:`str`, or, if ``columns`` is given, each item of it is. The texts are not
+    clipped to the widths of the columns.
+
+    Rows can be added with :meth:`append`, :meth:`extend` and :meth:`feed`, which work as long as the ``source`` is a
+    list, while the user keeps scrolling. If the ``source`` gets modified in any other way, call :meth:`refresh`.
+    Either way, the view gets redrawn at most once per frame, the next time the ``clock`` advances. While the view is
+    at the end of the rows, it stays there as more rows arrive, like a log tail, unless ``follow_tail`` is False.
+
+    **Scrolling**
+
+    :meth:`handle_events` makes the list react to resizing, the mouse wheel, and the Up, Down, Prior, Next, Home and
+    End keys, until it gets cancelled. :meth:`yview` follows the protocol of :meth:`tkinter.Canvas.yview`, so that
+    it can be the ``command`` of a :class:`tkinter.Scrollbar`.
+
+    .. versionadded:: 0.6.0
+    '''
+    def __init__(
+            self, clock: Clock, master, *, source: Sequence=None, columns: Sequence[int]=None, row_height=20,
+            font='TkDefaultFont', fill='black', follow_tail=True, yscrollcommand=None, **canvas_options):
+        self.canvas = canvas = tkinter.Canvas(master, **canvas_options)
+        self.source = [] if source is None else source
+        self.row_height = row_height
+        self.follow_tail = follow_tail
+        self.yscrollcommand = yscrollcommand
+        self._clock = clock
+        self._font = font
+        self._fill = fill
+        pad = 4
+        self._column_xs = xs = [pad]
+        if columns is not None:
+            for width in columns[:-1]:
+                xs.append(xs[-1] + width)
+        self._n_columns = None if columns is None else len(columns)
+        self._top = 0.  # the position of the view, in pixels from the top of the first row
+        self._drawn_top = None
+        self._viewport_height = canvas.winfo_reqheight()
+        self._at_bottom = True
+        self._slots = []  # [row index or None, item ids]
+        self._render_event = None
+        self._prev_fractions = None
+        self._resize(self._viewport_height)
+
+    def append(self, row):
+        '''Adds a row to the end of the ``source``.'''
+        self.source.append(row)
+        self._invalidate()
+
+    def extend(self, rows):
+        '''Adds rows to the end of the ``source``.'''
+        self.source.extend(rows)
+        self._invalidate()
+
+    async def feed(self, rows: AsyncIterable):
+        '''
+        Adds the rows an async iterable yields to the end of the ``source``, as they arrive, until it gets exhausted.
+        '''
+        append = self.source.append
+        invalidate = self._invalidate
+        async for row in rows:
+            append(row)
+            invalidate()
+
+    def refresh(self):
+        '''Redraws all the visible rows, for when the ``source`` has been modified directly.'''
+        for slot in self._slots:
+            slot[0] = None
+        self._invalidate()
+
+    def yview(self, *args):
+        '''
+        Same as :meth:`tkinter.Canvas.yview`. Without arguments, returns the fractions of the rows that are visible.
+        With ``"moveto", fraction`` or ``"scroll", number, "units" | "pages"``, moves the view.
+        '''
+        if not args:
+            return self._fractions()
+        if args[0] == 'moveto':
+            self._top = float(args[1]) * len(self.source) * self.row_height
+        elif args[0] == 'scroll':
+            n = float(args[1])
+            self._top += n * (self._viewport_height if args[2] == 'pages' else self.row_height)
+        else:
+            raise ValueError(f"Unknown yview command: {args[0]!r}")
+        self._at_bottom = False
+        self._invalidate()
+
+    def see(self, index):
+        '''Moves the view, if necessary, so that the row at the ``index`` is fully visible.'''
+        h = self.row_height
+        y = index * h
+        if y < self._top:
+            self._top = y
+        elif y + h > self._top + self._viewport_height:
+            self._top = y + h - self._viewport_height
+        else:
+            return
+        self._at_bottom = False
+        self._invalidate()
+
+    def index_at(self, y) -> int | None:
+        '''
+        Returns the index of the row at the ``y`` coordinate of the canvas, e.g. the ``y`` of a mouse event, or None
+        if there is no row there.
+        '''
+        index = int((self._top + y) // self.row_height)
+        return index if 0 <= index < len(self.source) else None
+
+    async def handle_events(self):
+        '''Reacts to resizing, the mouse wheel and the keyboard until cancelled.'''
+        canvas = self.canvas
+        yview = self.yview
+        with event_any_freq(
+            (canvas, "<Configure>"),
+            (canvas, "<MouseWheel>"),
+            (canvas, "<Button-4>"),
+            (canvas, "<Button-5>"),
+            (canvas, "<KeyPress>"),
+            (canvas, "<ButtonPress-1>"),
+            fields=('height', 'delta', 'keysym'),
+        ) as next_event:
+            while True:
+                index, e = await next_event()
+                if index == 0:
+                    self._resize(e.height)
+                elif index == 1:
+                    # Windows reports multiples of 120, macOS reports small numbers.
+                    delta = e.delta / 120 if abs(e.delta) >= 120 else e.delta
+                    yview('scroll', -3 * delta, 'units')
+                elif index == 2:
+                    yview('scroll', -3, 'units')
+                elif index == 3:
+                    yview('scroll', 3, 'units')
+                elif index == 4:
+                    if (action := _KEY_ACTIONS.get(e.keysym)) is not None:
+                        yview(*action)
+                else:
+                    canvas.focus_set()
+
+    def _resize(self, height):
+        self._viewport_height = height = max(height, 0)
+        n_slots = ceil(height / self.row_height) + 1
+        slots = self._slots
+        if n_slots == len(slots):
+            self._invalidate()
+            return
+        canvas = self.canvas
+        if n_slots > len(slots):
+            create_text = canvas.create_text
+            font = self._font
+            fill = self._fill
+            for __ in range(n_slots - len(slots)):
+                slots.append([None, [
+                    create_text(x, 0, anchor='w', text='', font=font, fill=fill) for x in self._column_xs
+                ]])
+        else:
+            for __, items in slots[n_slots:]:
+                canvas.delete(*items)
+            del slots[n_slots:]
+        # The mapping from rows to slots depends on the number of the slots.
+        for slot in slots:
+            slot[0] = None
+        self._invalidate()
+
+    def _invalidate(self):
+        if self._render_event is None:
+            self._render_event = self._clock.schedule_interval(self._render, 0)
+
+    def _render(self, dt):
+        self._render_event.cancel()
+        self._render_event = None
+        source = self.source
+        n_rows = len(source)
+        h = self.row_height
+        max_top = max(n_rows * h - self._viewport_height, 0)
+        if self.follow_tail and self._at_bottom:
+            top = max_top
+        else:
+            top = min(max(self._top, 0.), max_top)
+        self._top = top
+        self._at_bottom = top >= max_top
+        moved = top != self._drawn_top
+        self._drawn_top = top
+
+        path = self.canvas._w
+        script = []
+        append = script.append
+        slots = self._slots
+        n_slots = len(slots)
+        first = int(top // h)
+        n_columns = self._n_columns
+        for i in range(n_slots):
+            slot = slots[i]
+            # The slot 'i' shows the rows whose index modulo 'n_slots' is 'i'.
+            index = first + (i - first) % n_slots
+            if index >= n_rows:
+                if slot[0] != -1:
+                    slot[0] = -1
+                    for item in slot[1]:
+                        append(_join((path, 'itemconfigure', item, '-text', '', )))
+                continue
+            if slot[0] != index:
+                slot[0] = index
+                row = source[index]
+                if n_columns is None:
+                    append(_join((path, 'itemconfigure', slot[1][0], '-text', str(row), )))
+                else:
+                    for item, value in zip(slot[1], row):
+                        append(_join((path, 'itemconfigure', item, '-text', str(value), )))
+            elif not moved:
+                continue
+            y = index * h - top + h / 2
+            for item, x in zip(slot[1], self._column_xs):
+                append(_join((path, 'coords', item, x, y, )))
+        if script:
+            try:
+                self.canvas.tk.eval('\n'.join(script))
+            except tkinter.TclError:
+                if _is_alive(self.canvas):
+                    raise
+                # The canvas has been destroyed.
+                return
+        if (yscrollcommand := self.yscrollcommand) is not None:
+            fractions = self._fractions()
+            if fractions != self._prev_fractions:
+                self._prev_fractions = fractions
+                yscrollcommand(*fractions)
+
+    def _fractions(self):
+        total = len(self.source) * self.row_height
+        if total <= self._viewport_height:
+            return (0., 1., )
+        top = self._top
+        return (top / total, (top + self._viewport_height) / total, )
+
+
+_KEY_ACTIONS = {
+    'Up': ('scroll', -1, 'units', ),
+    'Down': ('scroll', 1, 'units', ),
+    'Prior': ('scroll', -1, 'pages', ),
+    'Next': ('scroll', 1, 'pages', ),
+    'Home': ('moveto', 0, ),
+    'End': ('moveto', 1, ),
+}